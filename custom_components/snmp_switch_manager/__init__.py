@@ -28,6 +28,12 @@ from .const import (
     DEFAULT_BANDWIDTH_POLL_INTERVAL,
     CONF_FEATURE_OVERRIDES,
     CONF_UPTIME_POLL_INTERVAL,
+    CONF_SNMP_TIMEOUT,
+    CONF_SNMP_RETRIES,
+    CONF_MAX_CONCURRENT_WALKS,
+    DEFAULT_SNMP_TIMEOUT,
+    DEFAULT_SNMP_RETRIES,
+    DEFAULT_MAX_CONCURRENT_WALKS,
     DEFAULT_UPTIME_POLL_INTERVAL,
     CONF_BW_ENABLE,
     CONF_BW_MODE,
@@ -52,6 +58,13 @@ from .const import (
     DEFAULT_ENV_POLL_INTERVAL,
     CONF_HIDE_IP_ON_PHYSICAL,
     CONF_HIDE_IP_ON_PHYSICAL_INTERFACES,
+    CONF_INCLUDE_STARTS_WITH,
+    CONF_INCLUDE_CONTAINS,
+    CONF_INCLUDE_ENDS_WITH,
+    CONF_EXCLUDE_STARTS_WITH,
+    CONF_EXCLUDE_CONTAINS,
+    CONF_EXCLUDE_ENDS_WITH,
+    CONF_DISABLED_VENDOR_FILTER_RULE_IDS,
     OID_sysName,
     OID_sysContact,
     OID_sysLocation,
@@ -155,9 +168,16 @@ def _apply_port_rename_all(
 
 
 def _postprocess_if_names(
-    data: dict, options: dict, rules: list[tuple[str, _re.Pattern[str], str]]
+    data: dict,
+    options: dict,
+    rules: list[tuple[str, _re.Pattern[str], str]],
+    renamed_by_raw: dict[str, str] | None = None,
 ) -> dict:
-    """Apply port rename rules to ifTable names in coordinator data."""
+    """Apply port rename rules to ifTable names in coordinator data.
+
+    ``renamed_by_raw`` memoizes rule output per name; the rules are fixed for
+    the life of the entry and port names repeat on every poll.
+    """
     # Persist option flags for downstream consumers
     data["hide_ip_on_physical"] = bool(
         options.get(
@@ -177,7 +197,12 @@ def _postprocess_if_names(
         raw = str(row.get("name") or row.get("descr") or "")
         if not raw:
             continue
-        renamed = _apply_port_rename_all(raw, rules)
+        if renamed_by_raw is None:
+            renamed = _apply_port_rename_all(raw, rules)
+        else:
+            renamed = renamed_by_raw.get(raw)
+            if renamed is None:
+                renamed = renamed_by_raw[raw] = _apply_port_rename_all(raw, rules)
         # Preserve original for debugging / power users
         if renamed != raw and "name_raw" not in row:
             row["name_raw"] = raw
@@ -231,6 +256,19 @@ async def async_setup_entry(
         ),
     }
 
+    interface_options = {
+        key: entry.options.get(key, []) or []
+        for key in (
+            CONF_INCLUDE_STARTS_WITH,
+            CONF_INCLUDE_CONTAINS,
+            CONF_INCLUDE_ENDS_WITH,
+            CONF_EXCLUDE_STARTS_WITH,
+            CONF_EXCLUDE_CONTAINS,
+            CONF_EXCLUDE_ENDS_WITH,
+            CONF_DISABLED_VENDOR_FILTER_RULE_IDS,
+        )
+    }
+
     client = SwitchSnmpClient(
         hass,
         host,
@@ -241,14 +279,22 @@ async def async_setup_entry(
         poe_options=poe_options,
         env_options=env_options,
         feature_overrides=entry.options.get(CONF_FEATURE_OVERRIDES) or {},
+        interface_options=interface_options,
+        timeout=entry.options.get(CONF_SNMP_TIMEOUT, DEFAULT_SNMP_TIMEOUT),
+        retries=entry.options.get(CONF_SNMP_RETRIES, DEFAULT_SNMP_RETRIES),
+        max_concurrent_walks=entry.options.get(CONF_MAX_CONCURRENT_WALKS, DEFAULT_MAX_CONCURRENT_WALKS),
     )
     try:
         await client.async_initialize()
     except SnmpAuthError as exc:
+        await client.async_close()
         raise ConfigEntryAuthFailed(
             f"SNMP authentication failed for {host}: {exc}"
         ) from exc
     except SnmpConnectionError as exc:
+        # Setup is retried with a fresh client; don't leave this one's
+        # dispatcher and socket behind on every attempt.
+        await client.async_close()
         raise ConfigEntryNotReady(
             f"Failed to connect to SNMP device at {host}: {exc}"
         ) from exc
@@ -262,6 +308,7 @@ async def async_setup_entry(
         "rename_rules", []
     )
     port_rename_rules = _build_port_rename_rules(entry.options, default_rename_rules)
+    renamed_by_raw: dict[str, str] = {}
 
     async def _update_method():
         try:
@@ -275,8 +322,10 @@ async def async_setup_entry(
                 )
             except Exception as e:
                 _LOGGER.debug("Failed to dismiss persistent notification: %s", e)
-            return _postprocess_if_names(data, entry.options, port_rename_rules)
+            return _postprocess_if_names(data, entry.options, port_rename_rules, renamed_by_raw)
         except SnmpConnectionError as exc:
+            # The host may have moved (e.g. a new DHCP lease); re-resolve next poll.
+            client.invalidate_target()
             # Failure: create unreachable persistent notification with offline illustration
             try:
                 from homeassistant.components import persistent_notification
@@ -7,6 +7,7 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
@@ -29,7 +30,7 @@ from .const import (
     SNMPV3_PRIV_DES,
     CONF_LEGACY_DEVICE_ID,
 )
-from .helpers import test_connection, get_sysname
+from .helpers import async_release_probe_client, test_connection, get_sysname
 from .snmp_compat import SnmpAuthError, SnmpConnectionError
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
@@ -59,6 +60,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         from .options_flow import OptionsFlowHandler
         return OptionsFlowHandler(config_entry)
 
+    @callback
+    def async_remove(self) -> None:
+        """Close this flow's probe client when the flow finishes or is aborted."""
+        super().async_remove()
+        host = getattr(self, "_setup_host", None)
+        if host:
+            self.hass.async_create_task(async_release_probe_client(host))
+
     async def async_step_user(self, user_input=None) -> FlowResult:
         errors: dict[str, str] = {}
 
@@ -252,11 +261,14 @@ def _normalize_oid(value: str) -> str:
     return v
 
 
+_RE_NUMERIC_OID = re.compile(r"(\d+\.)*\d+")
+
+
 def _is_valid_numeric_oid(value: str) -> bool:
     v = _normalize_oid(value)
     if not v:
         return True
-    return bool(re.fullmatch(r"(\d+\.)*\d+", v))
+    return bool(_RE_NUMERIC_OID.fullmatch(v))
 
 
 def _split_list(value: str) -> list[str]:
@@ -16,6 +16,17 @@ CONF_PORT = "port"
 CONF_COMMUNITY = "community" 
 
 DEFAULT_PORT = 161
+DEFAULT_SNMP_TIMEOUT = 2.0  # seconds per request attempt
+DEFAULT_SNMP_RETRIES = 1
+DEFAULT_BULK_MAX_REPETITIONS = 25  # rows per column in each GETBULK PDU
+GET_MANY_MAX_VARBINDS = 32  # varbinds per GET PDU when fetching many scalars
+DEFAULT_MAX_CONCURRENT_WALKS = 4  # table walks in flight per device
+DEFAULT_IF_INDEX_CACHE_TTL = 3600  # seconds a walked ifIndex set is trusted for GET polling
+DEFAULT_STATIC_REFRESH_INTERVAL = 3600  # seconds between full ifTable/VLAN re-walks
+DEFAULT_ALIAS_REFRESH_INTERVAL = 600  # seconds between ifAlias re-walks
+DEFAULT_IPV4_EMPTY_POLLS = 3  # empty IPv4 polls before backing off (pure L2 switch)
+DEFAULT_IPV4_EMPTY_POLL_INTERVAL = 3600  # seconds between IPv4 re-probes once backed off
+DEFAULT_TARGET_RESOLVE_TTL = 3600  # seconds before the transport target re-resolves the host
 DEFAULT_POLL_INTERVAL = 10  # seconds
 CONF_POLL_INTERVAL = "poll_interval"
 MIN_POLL_INTERVAL = 5    # seconds
@@ -86,6 +97,7 @@ OID_dot1qVlanCurrentUntaggedPorts = "1.3.6.1.2.1.17.7.1.4.2.1.5"
 OID_dot1qVlanStaticEgressPorts = "1.3.6.1.2.1.17.7.1.4.3.1.2"
 OID_dot1qVlanStaticUntaggedPorts = "1.3.6.1.2.1.17.7.1.4.3.1.4"
 OID_ipAddressIfIndex = "1.3.6.1.2.1.4.34.1.3"
+OID_ipAddressPrefix = "1.3.6.1.2.1.4.34.1.5"
 OID_ospfIfIpAddress = "1.3.6.1.2.1.14.8.1.1"
 OID_routeCol = "1.3.6.1.2.1.4.24.7.1.9"
 
@@ -123,6 +135,14 @@ DEFAULT_UPTIME_POLL_INTERVAL = 300  # seconds
 MIN_UPTIME_POLL_INTERVAL = 30  # seconds
 MAX_UPTIME_POLL_INTERVAL = 3600  # seconds
 
+CONF_SNMP_TIMEOUT = "snmp_timeout"
+MIN_SNMP_TIMEOUT = 0.5  # seconds
+MAX_SNMP_TIMEOUT = 30.0  # seconds
+CONF_SNMP_RETRIES = "snmp_retries"
+MAX_SNMP_RETRIES = 5
+CONF_MAX_CONCURRENT_WALKS = "max_concurrent_walks"
+MAX_MAX_CONCURRENT_WALKS = 8
+
 CONF_BANDWIDTH_POLL_INTERVAL = "bandwidth_poll_interval"
 DEFAULT_BANDWIDTH_POLL_INTERVAL = 30  # seconds
 MIN_BANDWIDTH_POLL_INTERVAL = 5  # seconds
@@ -80,3 +80,23 @@ def build_auth_data(settings: Dict[str, Any]):
     except Exception:
         # Fall back to the safest noAuthNoPriv when input is invalid.
         return UsmUserData(username)
+
+
+def engine_key(settings: Dict[str, Any]) -> tuple:
+    """Return the key of the SnmpEngine a client with these settings may share.
+
+    hlapi registers v3 users in the engine's USM table by userName, so clients
+    whose v3 credentials differ must not share an engine. v2c community data
+    carries no per-engine secrets and can always share.
+    """
+    version = str((settings or {}).get("version") or SNMP_VERSION_V2C).lower()
+    if version != SNMP_VERSION_V3:
+        return (SNMP_VERSION_V2C,)
+    return (
+        SNMP_VERSION_V3,
+        str((settings or {}).get(CONF_SNMPV3_USERNAME) or "").strip(),
+        str((settings or {}).get(CONF_SNMPV3_AUTH_PROTOCOL) or SNMPV3_AUTH_NONE).strip().lower(),
+        str((settings or {}).get(CONF_SNMPV3_AUTH_PASSWORD) or ""),
+        str((settings or {}).get(CONF_SNMPV3_PRIV_PROTOCOL) or SNMPV3_PRIV_NONE).strip().lower(),
+        str((settings or {}).get(CONF_SNMPV3_PRIV_PASSWORD) or ""),
+    )
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 from ..helpers import _parse_numeric
 from ..const import OID_hrProcessorLoad
 
+_RE_CPU_PERCENT = re.compile(r"([0-9]+(?:\.[0-9]+)?)\s*%")
+
 
 def _parse_cpu_string(cpu_val) -> tuple[Optional[float], Optional[float], Optional[float]]:
     """Extract up to three CPU percentages (5s, 60s, 300s) from a value string.
@@ -22,7 +24,7 @@ def _parse_cpu_string(cpu_val) -> tuple[Optional[float], Optional[float], Option
         return None, None, None
 
     cpu_s = str(cpu_val)
-    nums = re.findall(r"([0-9]+(?:\.[0-9]+)?)\s*%", cpu_s)
+    nums = _RE_CPU_PERCENT.findall(cpu_s)
     if len(nums) >= 3:
         return float(nums[0]), float(nums[1]), float(nums[2])
 
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
-from ..helpers import parse_pfsense_sysdescr
+from ..helpers import parse_system_info
 from ..const import OID_entPhysicalModelName, OID_sysDescr, OID_sysObjectID, OID_sysName, OID_sysUpTime
 
 
@@ -18,27 +18,23 @@ async def _fetch_oid_str(client: "SwitchSnmpClient", oid: str) -> Optional[str]:
         return None
 
 
-def _parse_sysdescr_generic(sd: str, model_hint: Optional[str]) -> tuple[Optional[str], Optional[str]]:
-    """Parse manufacturer and firmware from a generic comma-split sysDescr."""
-    parts = [p.strip() for p in sd.split(",")]
-    firmware = parts[1] if len(parts) >= 2 else None
-    head = parts[0]
-    if model_hint and model_hint in head:
-        manufacturer = head.replace(model_hint, "").strip() or None
-    else:
-        toks = head.split()
-        manufacturer = " ".join(toks[:-1]) if len(toks) > 1 else None
-    return manufacturer, firmware or None
-
-
 async def initialize_device_info(client: "SwitchSnmpClient") -> None:
     """Populate manufacturer, firmware, model, and vendor flags on first connect."""
-    # Core system fields
-    client.cache["sysDescr"] = await client._async_get_one(OID_sysDescr)
-    client.cache["sysObjectID"] = await client._async_get_one(OID_sysObjectID)
+    # Core system fields, fetched in a single GET
+    sysname_oid = client._custom_oid("hostname") or OID_sysName
+    uptime_oid = client._custom_oid("uptime") or OID_sysUpTime
+    core_oids = [OID_sysDescr, OID_sysObjectID, sysname_oid, uptime_oid]
+    values = await client._async_get_many(core_oids)
+    # A bad custom OID can fail the whole PDU; retry any gaps one by one.
+    for oid in core_oids:
+        if values.get(oid) is None:
+            values[oid] = await client._async_get_one(oid)
+
+    client.cache["sysDescr"] = values[OID_sysDescr]
+    client.cache["sysObjectID"] = values[OID_sysObjectID]
     client.cache["vendor"] = client._get_vendor()
-    client.cache["sysName"] = await client._async_get_one(client._custom_oid("hostname") or OID_sysName)
-    client.cache["sysUpTime"] = await client._async_get_one(client._custom_oid("uptime") or OID_sysUpTime)
+    client.cache["sysName"] = values[sysname_oid]
+    client.cache["sysUpTime"] = values[uptime_oid]
 
     # Model hint from ENTITY-MIB (first non-empty entry)
     model_hint: Optional[str] = next(
@@ -48,7 +44,7 @@ async def initialize_device_info(client: "SwitchSnmpClient") -> None:
     client.cache["model"] = model_hint
 
     sd = (client.cache.get("sysDescr") or "").strip()
-    pfs = parse_pfsense_sysdescr(sd)
+    info = parse_system_info(sd, model_hint)
 
     manufacturer: Optional[str] = None
     firmware: Optional[str] = None
@@ -63,14 +59,14 @@ async def initialize_device_info(client: "SwitchSnmpClient") -> None:
             client.cache["model"] = vendor_info["model_fallback"]
 
     # pfSense overrides generic parsing
-    if pfs.get("manufacturer"):
-        manufacturer = pfs["manufacturer"] or manufacturer
-        firmware = pfs["firmware"] or firmware
-        if pfs.get("model"):
-            client.cache["model"] = pfs["model"]
+    if info.is_pfsense:
+        manufacturer = info.manufacturer or manufacturer
+        firmware = info.firmware or firmware
+        if info.model:
+            client.cache["model"] = info.model
             model_hint = client.cache["model"]
     elif sd:
-        manufacturer, firmware = _parse_sysdescr_generic(sd, model_hint)
+        manufacturer, firmware = info.manufacturer, info.firmware
 
     # Vendor-specific OID overrides from database
     vendor = client.cache.get("vendor", "Unknown")
@@ -100,21 +96,21 @@ async def initialize_device_info(client: "SwitchSnmpClient") -> None:
 
 
 async def refresh_device_info(client: "SwitchSnmpClient") -> None:
-    """Re-evaluate manufacturer/firmware from sysDescr on every poll cycle."""
+    """Re-evaluate manufacturer/firmware when sysDescr changes or the agent restarts."""
     sd = (client.cache.get("sysDescr") or "").strip()
-    if not sd:
+    if not sd or sd == client._device_info_sysdescr:
         return
-
-    pfs = parse_pfsense_sysdescr(sd)
-    if pfs.get("manufacturer"):
-        client.cache["manufacturer"] = pfs["manufacturer"]
-        client.cache["firmware"] = pfs["firmware"]
-        if pfs.get("model"):
-            client.cache["model"] = pfs["model"]
+    client._device_info_sysdescr = sd
+
+    info = parse_system_info(sd, client.cache.get("model"))
+    if info.is_pfsense:
+        client.cache["manufacturer"] = info.manufacturer
+        client.cache["firmware"] = info.firmware
+        if info.model:
+            client.cache["model"] = info.model
         return
 
-    model_hint = client.cache.get("model")
-    manufacturer, firmware = _parse_sysdescr_generic(sd, model_hint)
+    manufacturer, firmware = info.manufacturer, info.firmware
 
     vendor = client.cache.get("vendor", "Unknown")
 
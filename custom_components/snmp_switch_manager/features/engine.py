@@ -1,13 +1,22 @@
 """PySNMP engine bootstrap and MIB preloading, offloaded to the executor."""
 from __future__ import annotations
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict
 
 if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Switches share SnmpEngines: pysnmp keys per-agent state by target and
+# credentials, so sharing saves a MIB preload, a dispatcher and a UDP socket
+# per device. The exception is SNMPv3 USM, whose user table is keyed by
+# userName, so each distinct v3 credential set gets its own engine (see
+# auth.engine_key). Clients hold a reference; the last release closes it.
+_shared_engines: Dict[tuple, list] = {}  # key -> [engine, refs]
+_shared_engine_lock = asyncio.Lock()
+
 
 def _build_engine_and_preload_mibs():
     """Build a SnmpEngine and preload all MIBs synchronously (runs in executor)."""
@@ -114,7 +123,27 @@ def _build_engine_and_preload_mibs():
 
 
 async def ensure_engine(client: "SwitchSnmpClient") -> None:
-    """Lazily build the SnmpEngine (runs MIB preloading in executor)."""
+    """Attach the client's shared SnmpEngine, building it on first use (in the executor)."""
     if client.engine is not None:
         return
-    client.engine = await client.hass.async_add_executor_job(_build_engine_and_preload_mibs)
+    # Concurrent first callers must not each build (and preload) an engine.
+    async with _shared_engine_lock:
+        if client.engine is None:
+            slot = _shared_engines.get(client.engine_key)
+            if slot is None:
+                engine = await client.hass.async_add_executor_job(_build_engine_and_preload_mibs)
+                slot = _shared_engines[client.engine_key] = [engine, 0]
+            slot[1] += 1
+            client.engine = slot[0]
+
+
+def release_engine(engine: Any) -> bool:
+    """Drop a client's reference to ``engine``; return True if the caller should close it."""
+    for key, slot in _shared_engines.items():
+        if slot[0] is engine:
+            slot[1] -= 1
+            if slot[1] > 0:
+                return False
+            del _shared_engines[key]
+            return True
+    return True
@@ -1,12 +1,11 @@
 """ENTITY-SENSOR-MIB cross-vendor fallback for temps, fans, and power."""
 from __future__ import annotations
-import asyncio
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
-from ..helpers import _parse_numeric, _entity_sensor_value_to_float
+from ..helpers import _oid_index, _parse_numeric, _entity_sensor_value_to_float
 
 # entPhySensorType table OIDs
 _OID_TYPE = "1.3.6.1.2.1.99.1.1.1.1"    # entPhySensorType
@@ -29,7 +28,7 @@ def _rows_to_int_dict(rows: list) -> dict[int, int]:
     result: dict[int, int] = {}
     for oid, val in rows:
         try:
-            idx = int(str(oid).split(".")[-1])
+            idx = _oid_index(oid)
         except Exception:
             continue
         n = _parse_numeric(val)
@@ -43,7 +42,7 @@ def _rows_to_any_dict(rows: list) -> dict[int, Any]:
     result: dict[int, Any] = {}
     for oid, val in rows:
         try:
-            idx = int(str(oid).split(".")[-1])
+            idx = _oid_index(oid)
         except Exception:
             continue
         result[idx] = val
@@ -63,21 +62,17 @@ async def poll_entity_sensor_fallback(client: "SwitchSnmpClient") -> None:
         return
 
     try:
-        types = _rows_to_int_dict(await client._async_walk(_OID_TYPE))
+        # All five columns share entPhySensorTable's index, so walk them in
+        # the same GETBULK requests; an empty table ends every column at once.
+        cols = await client._async_walk_columns([_OID_TYPE, _OID_VALUE, _OID_SCALE, _OID_PREC, _OID_OPER])
+        types = _rows_to_int_dict(cols[_OID_TYPE])
         if not types:
             return
 
-        value_rows, scale_rows, prec_rows, oper_rows = await asyncio.gather(
-            client._async_walk(_OID_VALUE),
-            client._async_walk(_OID_SCALE),
-            client._async_walk(_OID_PREC),
-            client._async_walk(_OID_OPER),
-        )
-
-        values = _rows_to_any_dict(value_rows)
-        scales = _rows_to_int_dict(scale_rows)
-        precs = _rows_to_int_dict(prec_rows)
-        opers = _rows_to_int_dict(oper_rows)
+        values = _rows_to_any_dict(cols[_OID_VALUE])
+        scales = _rows_to_int_dict(cols[_OID_SCALE])
+        precs = _rows_to_int_dict(cols[_OID_PREC])
+        opers = _rows_to_int_dict(cols[_OID_OPER])
 
         temps_c: dict[int, int] = dict(client.cache.get("env_temps_c") or {})
         fans_rpm: dict[int, int] = dict(client.cache.get("env_fans_rpm") or {})
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
-from ..helpers import _parse_numeric
+from ..helpers import _oid_index, _parse_numeric, decode_label
 from ..const import (
     OID_entPhysicalName,
     OID_entPhysicalDescr,
@@ -34,14 +34,8 @@ async def poll_h3c_environment(client: SwitchSnmpClient) -> None:
     try:
         for oid, val in await client._async_walk(OID_entPhysicalName):
             try:
-                idx = int(str(oid).split(".")[-1])
-                name_str = ""
-                if hasattr(val, "asOctets"):
-                    name_str = val.asOctets().decode("utf-8", "ignore")
-                elif hasattr(val, "prettyPrint"):
-                    name_str = val.prettyPrint()
-                else:
-                    name_str = str(val)
+                idx = _oid_index(oid)
+                name_str = decode_label(val)
                 if name_str:
                     physical_names[idx] = name_str.strip()
             except Exception:
@@ -54,14 +48,8 @@ async def poll_h3c_environment(client: SwitchSnmpClient) -> None:
         try:
             for oid, val in await client._async_walk(OID_entPhysicalDescr):
                 try:
-                    idx = int(str(oid).split(".")[-1])
-                    desc_str = ""
-                    if hasattr(val, "asOctets"):
-                        desc_str = val.asOctets().decode("utf-8", "ignore")
-                    elif hasattr(val, "prettyPrint"):
-                        desc_str = val.prettyPrint()
-                    else:
-                        desc_str = str(val)
+                    idx = _oid_index(oid)
+                    desc_str = decode_label(val)
                     if desc_str:
                         physical_names[idx] = desc_str.strip()
                 except Exception:
@@ -74,7 +62,7 @@ async def poll_h3c_environment(client: SwitchSnmpClient) -> None:
         cpu_by_idx = {}
         for oid, val in await client._async_walk(oid_h3c_cpu):
             try:
-                idx = int(str(oid).split(".")[-1])
+                idx = _oid_index(oid)
                 n = _parse_numeric(val)
                 if n is not None and 0 <= n <= 100:
                     cpu_by_idx[idx] = float(n)
@@ -109,7 +97,7 @@ async def poll_h3c_environment(client: SwitchSnmpClient) -> None:
         mem_by_idx = {}
         for oid, val in await client._async_walk(oid_h3c_mem):
             try:
-                idx = int(str(oid).split(".")[-1])
+                idx = _oid_index(oid)
                 n = _parse_numeric(val)
                 if n is not None and 0 <= n <= 100:
                     mem_by_idx[idx] = float(n)
@@ -140,7 +128,7 @@ async def poll_h3c_environment(client: SwitchSnmpClient) -> None:
     try:
         for oid, val in await client._async_walk(oid_h3c_temp):
             try:
-                idx = int(str(oid).split(".")[-1])
+                idx = _oid_index(oid)
                 n = _parse_numeric(val)
                 if n is not None and n != 65535 and -50 <= n <= 200:
                     temps_c[idx] = int(n)
@@ -155,7 +143,7 @@ async def poll_h3c_environment(client: SwitchSnmpClient) -> None:
     try:
         for oid, val in await client._async_walk(oid_h3c_error_status):
             try:
-                idx = int(str(oid).split(".")[-1])
+                idx = _oid_index(oid)
                 st_n = _parse_numeric(val)
                 if st_n is not None:
                     st_n = int(st_n)
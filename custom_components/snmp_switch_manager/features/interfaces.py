@@ -1,11 +1,13 @@
 from __future__ import annotations
 import asyncio
-from typing import TYPE_CHECKING, Dict
+import time
+from typing import TYPE_CHECKING, Any, Dict
 
 if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
 from ..const import (
+    GET_MANY_MAX_VARBINDS,
     OID_ifIndex,
     OID_ifDescr,
     OID_ifName,
@@ -26,23 +28,73 @@ from ..const import (
 
 try:
     from ..helpers import (
+        _oid_index,
         _parse_numeric,
+        decode_label,
         _decode_bridge_port_bitmap,
         classify_port_type,
     )
 except ImportError:
     from custom_components.snmp_switch_manager.helpers import (
+        _oid_index,
         _parse_numeric,
+        decode_label,
         _decode_bridge_port_bitmap,
         classify_port_type,
     )
 
+_STATIC_COLUMNS = (OID_ifIndex, OID_ifDescr, OID_ifName, OID_ifAlias, OID_ifType, OID_ifConnectorPresent)
+_DYNAMIC_COLUMNS = (OID_ifAdminStatus, OID_ifOperStatus, OID_ifSpeed, OID_ifHighSpeed)
+
+
+def _targeted_gets_cheaper(client: SwitchSnmpClient, wanted: list[int]) -> bool:
+    """Return True if GETting the wanted rows takes fewer PDUs than walking the columns."""
+    get_pdus = -(-len(_DYNAMIC_COLUMNS) * len(wanted) // GET_MANY_MAX_VARBINDS)
+    # A multi-column walk carries max_repetitions rows per PDU, plus one to see the end.
+    bulk_pdus = len(client.cache["ifTable"]) // max(1, client.max_repetitions) + 1
+    return get_pdus < bulk_pdus
+
+
+async def _get_dynamic_rows(client: SwitchSnmpClient, indexes: list[int]) -> list[list[tuple[str, Any]]]:
+    """GET the dynamic ifTable columns for selected interfaces, shaped like walk rows."""
+    oids = [f"{base}.{idx}" for idx in indexes for base in _DYNAMIC_COLUMNS]
+    got = await client._async_get_many(oids) if oids else {}
+    columns: list[list[tuple[str, Any]]] = []
+    for base in _DYNAMIC_COLUMNS:
+        rows = []
+        for idx in indexes:
+            oid = f"{base}.{idx}"
+            # Missing instances come back as None; drop them.
+            # Hand back the parsed int so the consumers below don't re-parse text.
+            num = _parse_numeric(got.get(oid))
+            if num is not None:
+                rows.append((oid, num))
+        columns.append(rows)
+    return columns
+
+
+async def poll_if_aliases(client: SwitchSnmpClient) -> None:
+    """Refresh ifAlias for known interfaces (descriptions edited on the switch)."""
+    if_table = client.cache.get("ifTable") or {}
+    for oid, val in await client._async_walk(OID_ifAlias):
+        rec = if_table.get(_oid_index(oid))
+        if rec is not None:
+            rec["alias"] = decode_label(val)
+
+
 async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False) -> None:
     """Walk all interfaces and collect state."""
-    if not dynamic_only:
-        client.cache["ifTable"] = {}
-
-        # Walk all static interface columns in parallel.
+    if_table: Dict[int, Dict[str, Any]]
+    if dynamic_only:
+        if_table = client.cache.setdefault("ifTable", {})
+    else:
+        # Build the new table off to the side: client.cache is the coordinator's
+        # data, so entities and concurrent pollers keep seeing the old rows until
+        # the walk has finished (or keep them entirely if it fails).
+        if_table = {}
+
+        # Walk all static interface columns together in shared GETBULK PDUs.
+        static = await client._async_walk_columns(_STATIC_COLUMNS)
         (
             idx_rows,
             descr_rows,
@@ -50,39 +102,32 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
             alias_rows,
             iftype_rows,
             connector_rows,
-        ) = await asyncio.gather(
-            client._async_walk(OID_ifIndex),
-            client._async_walk(OID_ifDescr),
-            client._async_walk(OID_ifName),
-            client._async_walk(OID_ifAlias),
-            client._async_walk(OID_ifType),
-            client._async_walk(OID_ifConnectorPresent),
-        )
+        ) = (static[base] for base in _STATIC_COLUMNS)
 
         # Indexes
         for oid, val in idx_rows:
-            idx = int(oid.split(".")[-1])
-            client.cache["ifTable"][idx] = {"index": idx}
+            idx = _oid_index(oid)
+            if_table[idx] = {"index": idx}
 
         # Descriptions
         for oid, val in descr_rows:
-            idx = int(oid.split(".")[-1])
-            client.cache["ifTable"].setdefault(idx, {})["descr"] = str(val)
+            idx = _oid_index(oid)
+            if_table.setdefault(idx, {})["descr"] = decode_label(val)
 
         # Names
         for oid, val in name_rows:
-            idx = int(oid.split(".")[-1])
-            client.cache["ifTable"].setdefault(idx, {})["name"] = str(val)
+            idx = _oid_index(oid)
+            if_table.setdefault(idx, {})["name"] = decode_label(val)
 
         # Aliases
         for oid, val in alias_rows:
-            idx = int(oid.split(".")[-1])
-            client.cache["ifTable"].setdefault(idx, {})["alias"] = str(val)
+            idx = _oid_index(oid)
+            if_table.setdefault(idx, {})["alias"] = decode_label(val)
 
         # ifType (needed for port classification)
         for oid, val in iftype_rows:
-            idx = int(oid.split(".")[-1])
-            rec = client.cache["ifTable"].get(idx)
+            idx = _oid_index(oid)
+            rec = if_table.get(idx)
             if rec is not None:
                 try:
                     rec["if_type"] = int(val)
@@ -91,8 +136,8 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
 
         # ifConnectorPresent (standard hardware presence indicator)
         for oid, val in connector_rows:
-            idx = int(oid.split(".")[-1])
-            rec = client.cache["ifTable"].get(idx)
+            idx = _oid_index(oid)
+            rec = if_table.get(idx)
             if rec is not None:
                 try:
                     # 1 = True (present/physical), 2 = False (absent/virtual)
@@ -106,7 +151,7 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
             baseport_by_ifindex: Dict[int, int] = {}
             for oid, val in await client._async_walk(OID_dot1dBasePortIfIndex):
                 try:
-                    base_port = int(oid.split(".")[-1])
+                    base_port = _oid_index(oid)
                 except Exception:
                     continue
                 try:
@@ -119,65 +164,68 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
             client.cache["ifindex_by_baseport"] = {v: k for k, v in baseport_by_ifindex.items() if v and k}
             if baseport_by_ifindex:
                 pvid_by_baseport: Dict[int, int] = {}
-                for oid, val in await client._async_walk(OID_dot1qPvid):
-                    try:
-                        base_port = int(oid.split(".")[-1])
-                    except Exception:
-                        continue
-                    try:
-                        pvid = int(_parse_numeric(val))
-                    except Exception:
-                        continue
-                    if pvid > 0:
-                        pvid_by_baseport[base_port] = pvid
-
                 allowed_by_baseport: Dict[int, set[int]] = {}
                 untagged_by_baseport: Dict[int, set[int]] = {}
 
-                async def _collect_vlan_portlists(oid_base: str, out: Dict[int, set[int]]) -> int:
-                    count = 0
-                    try:
-                        rows = await asyncio.wait_for(client._async_walk(oid_base), timeout=30.0)
-                    except asyncio.TimeoutError:
-                        return count
-                    for oid, val in rows:
+                async def _collect_pvids() -> None:
+                    # Walk to the end of the table rather than capping it at the
+                    # base-port count: sparse or differently indexed PVID
+                    # tables can have more rows than the base-port walk found.
+                    for oid, val in await client._async_walk(OID_dot1qPvid):
                         try:
-                            vlan_id = int(oid.split(".")[-1])
+                            base_port = _oid_index(oid)
                         except Exception:
                             continue
-                        if vlan_id <= 0:
-                            continue
-                        ports = _decode_bridge_port_bitmap(val)
-                        if not ports:
+                        try:
+                            pvid = int(_parse_numeric(val))
+                        except Exception:
                             continue
-                        count += 1
-                        for bp in ports:
-                            out.setdefault(bp, set()).add(vlan_id)
-                    return count
-
-                try:
-                    await _collect_vlan_portlists(OID_dot1qVlanCurrentEgressPorts, allowed_by_baseport)
-                except Exception:
-                    pass
+                        if pvid > 0:
+                            pvid_by_baseport[base_port] = pvid
 
-                try:
-                    await _collect_vlan_portlists(OID_dot1qVlanCurrentUntaggedPorts, untagged_by_baseport)
-                except Exception:
-                    pass
+                async def _collect_vlan_portlists(oid_base: str, out: Dict[int, set[int]]) -> int:
+                    # Decode each port bitmap as its response arrives rather than
+                    # holding every raw row; only merge once the walk completes.
+                    count = 0
+                    found: Dict[int, set[int]] = {}
+                    try:
+                        async with asyncio.timeout(30.0):
+                            async for oid, val in client._async_walk_iter(oid_base):
+                                try:
+                                    vlan_id = _oid_index(oid)
+                                except Exception:
+                                    continue
+                                if vlan_id <= 0:
+                                    continue
+                                ports = _decode_bridge_port_bitmap(val)
+                                if not ports:
+                                    continue
+                                count += 1
+                                for bp in ports:
+                                    found.setdefault(bp, set()).add(vlan_id)
+                    except TimeoutError:
+                        return 0
+                    for bp, vlans in found.items():
+                        out.setdefault(bp, set()).update(vlans)
+                    return count
 
-                # Fall back to static membership when current tables are not implemented.
-                try:
-                    await _collect_vlan_portlists(OID_dot1qVlanStaticEgressPorts, allowed_by_baseport)
-                except Exception:
-                    pass
-                try:
-                    await _collect_vlan_portlists(OID_dot1qVlanStaticUntaggedPorts, untagged_by_baseport)
-                except Exception:
-                    pass
+                # PVIDs and the current/static membership tables are independent;
+                # walk them concurrently. Static membership fills in when the
+                # current tables are not implemented.
+                pvid_result, *_ = await asyncio.gather(
+                    _collect_pvids(),
+                    _collect_vlan_portlists(OID_dot1qVlanCurrentEgressPorts, allowed_by_baseport),
+                    _collect_vlan_portlists(OID_dot1qVlanCurrentUntaggedPorts, untagged_by_baseport),
+                    _collect_vlan_portlists(OID_dot1qVlanStaticEgressPorts, allowed_by_baseport),
+                    _collect_vlan_portlists(OID_dot1qVlanStaticUntaggedPorts, untagged_by_baseport),
+                    return_exceptions=True,
+                )
+                if isinstance(pvid_result, BaseException):
+                    raise pvid_result
 
                 if pvid_by_baseport:
                     for if_index, base_port in baseport_by_ifindex.items():
-                        rec = client.cache["ifTable"].setdefault(if_index, {})
+                        rec = if_table.setdefault(if_index, {})
                         pvid = pvid_by_baseport.get(base_port)
 
                         if pvid is not None:
@@ -212,7 +260,7 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
             pass
 
         # Display name preference
-        for idx, rec in list(client.cache["ifTable"].items()):
+        for idx, rec in if_table.items():
             existing = (rec.get("display_name") or "").strip()
             if existing:
                 rec["display_name"] = existing
@@ -221,7 +269,10 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
             ds = (rec.get("descr") or "").strip()
             rec["display_name"] = nm or ds or f"ifIndex {idx}"
 
-        for idx, rec in client.cache["ifTable"].items():
+        classification_db = (
+            client._database.get("interface_classification") if hasattr(client, "_database") else None
+        )
+        for idx, rec in if_table.items():
             if not isinstance(rec, dict):
                 continue
             if_type = rec.get("if_type")
@@ -232,33 +283,51 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
                 name=name,
                 is_bridge_port=is_bridge_port,
                 connector_present=rec.get("connector_present"),
-                classification_db=client._database.get("interface_classification") if hasattr(client, "_database") else None,
+                classification_db=classification_db,
             )
             rec["is_bridge_port"] = is_bridge_port
 
-    admin_rows, oper_rows, speed_rows, hispeed_rows = await asyncio.gather(
-        client._async_walk(OID_ifAdminStatus),
-        client._async_walk(OID_ifOperStatus),
-        client._async_walk(OID_ifSpeed),
-        client._async_walk(OID_ifHighSpeed),
-    )
+    # Once the table is known, only refresh interfaces the include/exclude
+    # rules keep, using targeted GETs instead of walking every row.
+    # While the walked ifIndex set is fresh the same applies to every interface.
+    wanted = None
+    if dynamic_only:
+        wanted = client._wanted_if_indexes()
+        if wanted is None and client._if_indexes_fresh():
+            wanted = list(if_table)
+        # Targeted GETs only pay off for a small subset; a full set is
+        # cheaper to fetch with the multi-column GETBULK walk.
+        if wanted is not None and not _targeted_gets_cheaper(client, wanted):
+            wanted = None
+    if wanted is not None:
+        admin_rows, oper_rows, speed_rows, hispeed_rows = await _get_dynamic_rows(client, wanted)
+        refreshed = set(wanted)
+        if len(admin_rows) != len(wanted):
+            # An interface disappeared (or the agent errored); walk next time.
+            client._last_if_index_walk = 0.0
+    else:
+        dynamic = await client._async_walk_columns(_DYNAMIC_COLUMNS)
+        admin_rows, oper_rows, speed_rows, hispeed_rows = (dynamic[base] for base in _DYNAMIC_COLUMNS)
+        refreshed = set(if_table)
+        if admin_rows and len(admin_rows) == len(refreshed):
+            client._last_if_index_walk = time.monotonic()
 
     for oid, val in admin_rows:
-        idx = int(oid.split(".")[-1])
-        client.cache["ifTable"].setdefault(idx, {})["admin"] = int(val)
+        idx = _oid_index(oid)
+        if_table.setdefault(idx, {})["admin"] = int(val)
 
     for oid, val in oper_rows:
-        idx = int(oid.split(".")[-1])
-        client.cache["ifTable"].setdefault(idx, {})["oper"] = int(val)
+        idx = _oid_index(oid)
+        if_table.setdefault(idx, {})["oper"] = int(val)
 
     # Reset speed_bps for each interface to prevent stale values if speed becomes unknown
-    for idx, rec in client.cache["ifTable"].items():
-        if isinstance(rec, dict) and "speed_bps" in rec:
+    for idx, rec in if_table.items():
+        if idx in refreshed and isinstance(rec, dict) and "speed_bps" in rec:
             rec.pop("speed_bps", None)
 
     # Speeds (prefer ifHighSpeed where present; fall back to ifSpeed)
     for oid, val in speed_rows:
-        idx = int(oid.split(".")[-1])
+        idx = _oid_index(oid)
         try:
             bps = _parse_numeric(val)
             if not bps or bps <= 0:
@@ -266,10 +335,10 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
         except Exception:
             continue
         if bps > 0:
-            client.cache["ifTable"].setdefault(idx, {})["speed_bps"] = bps
+            if_table.setdefault(idx, {})["speed_bps"] = bps
 
     for oid, val in hispeed_rows:
-        idx = int(oid.split(".")[-1])
+        idx = _oid_index(oid)
         try:
             v = int(val)
         except Exception:
@@ -278,10 +347,10 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
         # Heuristic: values >= 1,000,000 are treated as bps to avoid 1e6x inflation.
         if v > 0:
             bps = v if v >= 1_000_000 else v * 1_000_000
-            client.cache["ifTable"].setdefault(idx, {})["speed_bps"] = bps
+            if_table.setdefault(idx, {})["speed_bps"] = bps
     
     # Specialty Math
-    for idx, rec in client.cache["ifTable"].items():
+    for idx, rec in if_table.items():
         if not isinstance(rec, dict):
             continue
         
@@ -292,3 +361,6 @@ async def poll_interfaces(client: SwitchSnmpClient, dynamic_only: bool = False)
         
         rec["speed_mbps"] = speed_mbps
         rec["speed"] = f"{int(speed_mbps)} Mbps" if speed_mbps > 0 else "Down"
+
+    if not dynamic_only:
+        client.cache["ifTable"] = if_table
@@ -1,5 +1,7 @@
 from __future__ import annotations
+import asyncio
 import ipaddress
+from functools import lru_cache
 from typing import TYPE_CHECKING, Dict, List, Tuple, Any, Optional
 
 if TYPE_CHECKING:
@@ -10,17 +12,70 @@ from ..const import (
     OID_ipAdEntIfIndex,
     OID_ipAdEntNetMask,
     OID_ipAddressIfIndex,
+    OID_ipAddressPrefix,
     OID_ospfIfIpAddress,
     OID_routeCol,
 )
 
 try:
-    from ..helpers import _parse_numeric
+    from ..helpers import _parse_numeric, ip_to_cidr, netmask_to_prefix
 except ImportError:
-    from custom_components.snmp_switch_manager.helpers import _parse_numeric
+    from custom_components.snmp_switch_manager.helpers import _parse_numeric, ip_to_cidr, netmask_to_prefix
 
-async def poll_ipv4(client: SwitchSnmpClient) -> None:
-    """Walk IPv4 addresses and attach them to interfaces."""
+_ADENT_IFINDEX_BASE_LEN = len(OID_ipAdEntIfIndex) + 1
+_ADENT_NETMASK_BASE_LEN = len(OID_ipAdEntNetMask) + 1
+_IPADDR_IFINDEX_BASE_LEN = len(OID_ipAddressIfIndex) + 1
+_IPADDR_PREFIX_BASE_LEN = len(OID_ipAddressPrefix) + 1
+_OSPF_IF_BASE_LEN = len(OID_ospfIfIpAddress) + 1
+_ROUTE_BASE_LEN = len(OID_routeCol) + 1
+
+
+def _decode_ipv4_index(oid: str, base_len: int) -> Optional[str]:
+    """Return the dotted IPv4 address encoded in an IP-MIB ipAddressTable index.
+
+    The common ``1.4.a.b.c.d`` index is sliced straight out of the OID string;
+    anything else falls back to scanning for the ``1.4`` marker.
+    """
+    suffix = oid[base_len:]
+    if suffix.startswith("1.4."):
+        ip = suffix[4:]
+        if ip.count(".") == 3:
+            return ip
+
+    parts = [int(x) for x in suffix.split(".") if x]
+    for i in range(0, len(parts) - 5):
+        if parts[i] == 1 and parts[i + 1] == 4:
+            a, b, c, d = parts[i + 2 : i + 6]
+            return f"{a}.{b}.{c}.{d}"
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _is_usable_ipv4(ip: str) -> bool:
+    """Filter out addresses that are almost always meaningless on L2 switch ports.
+
+    Every address is checked once per table it appears in (up to five per
+    poll), so the IPv4Address parse is cached across rows and polls.
+    """
+    try:
+        addr = ipaddress.IPv4Address(ip)
+    except Exception:
+        return False
+    if (
+        addr.is_loopback
+        or addr.is_unspecified
+        or addr.is_link_local
+        or addr.is_multicast
+        or addr.is_reserved
+    ):
+        return False
+    if ip == "255.255.255.255":
+        return False
+    return True
+
+
+async def poll_ipv4(client: SwitchSnmpClient) -> bool:
+    """Walk IPv4 addresses and attach them to interfaces; return False if none were found."""
     ip_index: Dict[str, int] = {}
     ip_mask: Dict[str, str] = {}  # primarily from (1) and (4)
 
@@ -54,36 +109,29 @@ async def poll_ipv4(client: SwitchSnmpClient) -> None:
     
         return s
 
-    def _is_usable_ipv4(ip: str) -> bool:
-        """Filter out addresses that are almost always meaningless on L2 switch ports."""
-        try:
-            addr = ipaddress.IPv4Address(ip)
-        except Exception:
-            return False
-        if (
-            addr.is_loopback
-            or addr.is_unspecified
-            or addr.is_link_local
-            or addr.is_multicast
-            or addr.is_reserved
-        ):
-            return False
-        if ip == "255.255.255.255":
-            return False
-        return True
+    # The address tables are independent, so walk them concurrently; the
+    # results are still merged in priority order below.
+    legacy_cols, ipmib_cols, ospf_rows, route_rows = await asyncio.gather(
+        client._async_walk_columns([OID_ipAdEntAddr, OID_ipAdEntIfIndex, OID_ipAdEntNetMask]),
+        client._async_walk_columns([OID_ipAddressIfIndex, OID_ipAddressPrefix]),
+        client._async_walk(OID_ospfIfIpAddress),
+        client._async_walk(OID_routeCol),
+        return_exceptions=True,
+    )
+    if isinstance(legacy_cols, BaseException):
+        raise legacy_cols
 
     # ---- (1) Legacy table: ipAdEnt* ----
-    legacy_addrs = await client._async_walk(OID_ipAdEntAddr)
-    if legacy_addrs:
-        for _oid, val in legacy_addrs:
+    if legacy_cols.get(OID_ipAdEntAddr):
+        for _oid, val in legacy_cols[OID_ipAdEntAddr]:
             ip = _normalize_ipv4(val)
             if not _is_usable_ipv4(ip):
                 continue
             ip_index[ip] = None  # type: ignore[assignment]
 
-        for oid, val in await client._async_walk(OID_ipAdEntIfIndex):
-            parts = oid.split(".")[-4:]
-            ip = ".".join(parts)
+        # ipAddrTable is indexed by the address itself, so the IP is the OID suffix.
+        for oid, val in legacy_cols.get(OID_ipAdEntIfIndex, []):
+            ip = oid[_ADENT_IFINDEX_BASE_LEN:]
             if not _is_usable_ipv4(ip):
                 continue
             try:
@@ -91,57 +139,44 @@ async def poll_ipv4(client: SwitchSnmpClient) -> None:
             except Exception:
                 continue
 
-        for oid, val in await client._async_walk(OID_ipAdEntNetMask):
-            parts = oid.split(".")[-4:]
-            ip = ".".join(parts)
+        for oid, val in legacy_cols.get(OID_ipAdEntNetMask, []):
+            ip = oid[_ADENT_NETMASK_BASE_LEN:]
             if not _is_usable_ipv4(ip):
                 continue
             ip_mask[ip] = _normalize_ipv4(val)
 
-    # ---- (2) IP-MIB ipAddressIfIndex ----
-    try:
-        for oid, val in await client._async_walk(OID_ipAddressIfIndex):
-            try:
-                suffix = oid[len(OID_ipAddressIfIndex) + 1 :]
-                parts = [int(x) for x in suffix.split(".") if x]
-                if len(parts) < 6:
-                    continue
+    # Masks the agent reported in ipAdEntNetMask; everything else below is derived.
+    reported_masks = set(ip_mask)
 
-                ip = None
-                for i in range(0, len(parts) - 5):
-                    if parts[i] == 1 and parts[i + 1] == 4:
-                        a, b, c, d = parts[i + 2 : i + 6]
-                        ip = f"{a}.{b}.{c}.{d}"
-                        break
-                if not ip or not _is_usable_ipv4(ip):
-                    continue
+    # ---- (2) IP-MIB ipAddressIfIndex + ipAddressPrefix (one bulk walk) ----
+    prefix_bits: Dict[str, int] = {}
+    if not isinstance(ipmib_cols, BaseException):
+        for oid, val in ipmib_cols.get(OID_ipAddressIfIndex, []):
+            ip = _decode_ipv4_index(oid, _IPADDR_IFINDEX_BASE_LEN)
+            if not ip or not _is_usable_ipv4(ip):
+                continue
+            idx = _parse_numeric(val)
+            if idx is not None:
+                ip_index[ip] = idx
 
-                idx = _parse_numeric(val)
-                if idx is None:
-                    continue
-                ip_index[ip] = int(idx)
-            except Exception:
+        # ipAddressPrefix is a RowPointer into ipAddressPrefixTable whose
+        # last sub-identifier is the prefix length.
+        for oid, val in ipmib_cols.get(OID_ipAddressPrefix, []):
+            ip = _decode_ipv4_index(oid, _IPADDR_PREFIX_BASE_LEN)
+            if not ip or not _is_usable_ipv4(ip):
                 continue
-    except Exception:
-        pass
+            tail = str(val).rpartition(".")[2]
+            if tail.isdigit() and 0 < int(tail) <= 32:
+                prefix_bits[ip] = int(tail)
 
     # ---- (3) OSPF-MIB ospfIfIpAddress ----
-    try:
-        for oid, val in await client._async_walk(OID_ospfIfIpAddress):
-            try:
-                suffix = oid[len(OID_ospfIfIpAddress) + 1 :]
-                parts = [int(x) for x in suffix.split(".")]
-                if len(parts) >= 5:
-                    a, b, c, d = parts[0], parts[1], parts[2], parts[3]
-                    if_index = parts[4]
-                    ip = f"{a}.{b}.{c}.{d}"
-                    if not _is_usable_ipv4(ip):
-                        continue
-                    ip_index[ip] = int(if_index)
-            except Exception:
+    if not isinstance(ospf_rows, BaseException):
+        for oid, val in ospf_rows:
+            # Index is ospfIfIpAddress.ospfAddressLessIf: "a.b.c.d.n".
+            ip, _, if_index = oid[_OSPF_IF_BASE_LEN:].rpartition(".")
+            if ip.count(".") != 3 or not if_index.isdigit() or not _is_usable_ipv4(ip):
                 continue
-    except Exception:
-        pass
+            ip_index[ip] = int(if_index)
 
     # ---- (4) Derive mask bits from IP-FORWARD-MIB route instances ----
     route_prefixes: List[Tuple[int, int]] = []
@@ -158,29 +193,34 @@ async def poll_ipv4(client: SwitchSnmpClient) -> None:
         a, b, c, d = (int(x) for x in ip.split("."))
         return (a << 24) | (b << 16) | (c << 8) | d
 
-    try:
-        for oid, _val in await client._async_walk(OID_routeCol):
+    if not isinstance(route_rows, BaseException):
+        for oid, _val in route_rows:
             try:
-                suffix = oid[len(OID_routeCol) + 1 :]
-                parts = [int(x) for x in suffix.split(".") if x]
+                suffix = oid[_ROUTE_BASE_LEN:]
+                # inetCidrRouteDest is normally first: "1.4.a.b.c.d.len....";
+                # only split off the fields we need instead of the whole index.
+                head = suffix.split(".", 7)
+                if len(head) == 8 and head[0] == "1" and head[1] == "4":
+                    a, b, c, d, bits = (int(x) for x in head[2:7])
+                    if 0 <= bits <= 32:
+                        route_prefixes.append(((a << 24) | (b << 16) | (c << 8) | d, bits))
+                    continue
 
+                parts = [int(x) for x in suffix.split(".") if x]
                 for i in range(len(parts) - 7):
                     if parts[i] == 1 and parts[i + 1] == 4:
                         a, b, c, d = parts[i + 2 : i + 6]
                         bits = parts[i + 6] if i + 6 < len(parts) else None
                         if bits is None or bits < 0 or bits > 32:
                             continue
-                        net_int = _ip_to_int(f"{a}.{b}.{c}.{d}")
-                        route_prefixes.append((net_int, bits))
+                        route_prefixes.append(((a << 24) | (b << 16) | (c << 8) | d, bits))
                         break
             except Exception:
                 continue
-    except Exception:
-        pass
 
     if route_prefixes and ip_index:
         route_prefixes.sort(key=lambda t: t[1], reverse=True)
-        for ip in list(ip_index.keys()):
+        for ip in ip_index:
             ip_int = _ip_to_int(ip)
             for net_int, bits in route_prefixes:
                 mask_int = (0xFFFFFFFF << (32 - bits)) & 0xFFFFFFFF if bits else 0
@@ -188,6 +228,12 @@ async def poll_ipv4(client: SwitchSnmpClient) -> None:
                     ip_mask[ip] = _bits_to_mask(bits)
                     break
 
+    # The agent's own ipAddressPrefix beats a mask guessed from the route
+    # table, but not one it reported directly in ipAdEntNetMask.
+    for ip, bits in prefix_bits.items():
+        if ip in ip_index and ip not in reported_masks:
+            ip_mask[ip] = _bits_to_mask(bits)
+
     # Commit maps to cache
     if ip_index:
         client.cache["ipIndex"] = ip_index
@@ -196,6 +242,7 @@ async def poll_ipv4(client: SwitchSnmpClient) -> None:
 
     # Attach to interfaces
     _attach_ipv4_to_interfaces(client)
+    return bool(ip_index)
 
 def _attach_ipv4_to_interfaces(client: SwitchSnmpClient) -> None:
     """Attach resolved IPv4 addresses to interface records."""
@@ -211,20 +258,6 @@ def _attach_ipv4_to_interfaces(client: SwitchSnmpClient) -> None:
         ):
             rec.pop(k, None)
 
-    def _mask_to_prefix(mask: str | None) -> Optional[int]:
-        if not mask:
-            return None
-        try:
-            parts = [int(p) for p in mask.split(".")]
-            if len(parts) != 4 or any(p < 0 or p > 255 for p in parts):
-                return None
-            bits = "".join(f"{p:08b}" for p in parts)
-            if "01" in bits:
-                return None
-            return bits.count("1")
-        except Exception:
-            return None
-
     for ip, idx in ip_idx.items():
         if not idx:
             continue
@@ -232,7 +265,7 @@ def _attach_ipv4_to_interfaces(client: SwitchSnmpClient) -> None:
         if not rec:
             continue
         mask = ip_mask.get(ip)
-        prefix = _mask_to_prefix(mask)
+        prefix = netmask_to_prefix(mask)
         rec.setdefault("ipv4", []).append({"ip": ip, "netmask": mask, "cidr": prefix})
 
     for rec in if_table.values():
@@ -266,3 +299,15 @@ def _attach_ipv4_to_interfaces(client: SwitchSnmpClient) -> None:
             ip_mask_by_ifindex[idx] = mask
     client.cache["ip_by_ifindex"] = ip_by_ifindex
     client.cache["ip_mask_by_ifindex"] = ip_mask_by_ifindex
+
+    # Device-wide "ip/prefix" per ifIndex, built once per IPv4 poll so the
+    # platforms don't each rebuild it.
+    ip_cidr: Dict[int, str] = {}
+    for ip, idx in ip_idx.items():
+        try:
+            idx = int(idx)
+        except Exception:
+            continue
+        mask = ip_mask.get(ip)
+        ip_cidr[idx] = (ip_to_cidr(ip, mask) if mask else None) or ip
+    client.cache["ipCidr"] = ip_cidr
@@ -1,12 +1,11 @@
 """Memory usage polling."""
 from __future__ import annotations
-import asyncio
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
-from ..helpers import _parse_numeric
+from ..helpers import _oid_index, _parse_numeric
 from ..const import (
     OID_hrStorageType,
     OID_hrStorageAllocationUnits,
@@ -21,7 +20,7 @@ def _walk_to_int_map(rows, filter_set: set[int] | None = None) -> dict[int, int]
     result: dict[int, int] = {}
     for oid, val in rows:
         try:
-            idx = int(str(oid).split(".")[-1])
+            idx = _oid_index(oid)
         except Exception:
             continue
         if filter_set is not None and idx not in filter_set:
@@ -73,26 +72,27 @@ async def poll_memory(client: "SwitchSnmpClient", vendor: str) -> None:
     # Fallback: HOST-RESOURCES-MIB hrStorageTable
     if client.cache["env_mem_total_kb"] is None or client.cache["env_mem_free_kb"] is None:
         try:
-            # Identify hrStorageRam entries
+            # hrStorageTable is small; fetch the type and size columns together
+            # and keep only the hrStorageRam rows.
+            cols = await client._async_walk_columns([
+                OID_hrStorageType,
+                OID_hrStorageAllocationUnits,
+                OID_hrStorageSize,
+                OID_hrStorageUsed,
+            ])
             ram_idxs: set[int] = set()
-            for oid, val in await client._async_walk(OID_hrStorageType):
+            for oid, val in cols[OID_hrStorageType]:
                 try:
-                    idx = int(str(oid).split(".")[-1])
+                    idx = _oid_index(oid)
                 except Exception:
                     continue
                 if OID_hrStorageRam in str(val):
                     ram_idxs.add(idx)
 
             if ram_idxs:
-                # Fetch all three columns in parallel, then filter
-                alloc_rows, size_rows, used_rows = await asyncio.gather(
-                    client._async_walk(OID_hrStorageAllocationUnits),
-                    client._async_walk(OID_hrStorageSize),
-                    client._async_walk(OID_hrStorageUsed),
-                )
-                alloc_units = _walk_to_int_map(alloc_rows, ram_idxs)
-                sizes = _walk_to_int_map(size_rows, ram_idxs)
-                useds = _walk_to_int_map(used_rows, ram_idxs)
+                alloc_units = _walk_to_int_map(cols[OID_hrStorageAllocationUnits], ram_idxs)
+                sizes = _walk_to_int_map(cols[OID_hrStorageSize], ram_idxs)
+                useds = _walk_to_int_map(cols[OID_hrStorageUsed], ram_idxs)
 
                 total_bytes = used_bytes = 0
                 for idx in ram_idxs:
@@ -19,7 +19,7 @@ from ..const import (
     OID_pethPsePortAdminEnable,
     OID_pethPsePortPowerPriority,
 )
-from ..helpers import _parse_numeric
+from ..helpers import _oid_index, _parse_numeric
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,10 +33,6 @@ def _extract_floats(rows) -> list[float]:
     return result
 
 
-def _oid_last_idx(oid: str) -> int:
-    return int(str(oid).split(".")[-1])
-
-
 async def poll_poe(client: "SwitchSnmpClient") -> None:
     """Poll PoE budget and per-port power data from device."""
     poe_enabled = bool(client._poe_options.get(CONF_POE_ENABLE, False))
@@ -168,7 +164,7 @@ async def poll_poe(client: "SwitchSnmpClient") -> None:
         for oid, val in dell_poe_rows:
             mw = _parse_numeric(val)
             if mw is not None:
-                poe_power_mw[_oid_last_idx(oid)] = float(mw)
+                poe_power_mw[_oid_index(oid)] = float(mw)
     except Exception:
         pass
 
@@ -176,7 +172,7 @@ async def poll_poe(client: "SwitchSnmpClient") -> None:
     try:
         ifindex_map = client.cache.get("ifindex_by_baseport", {})
         for oid, val in std_poe_rows:
-            port_idx = _oid_last_idx(oid)
+            port_idx = _oid_index(oid)
             target_idx = ifindex_map.get(port_idx, port_idx)
             if target_idx not in poe_power_mw:
                 mw = _parse_numeric(val)
@@ -191,18 +187,17 @@ async def poll_poe(client: "SwitchSnmpClient") -> None:
     if poe_control_loops:
         admin_map = {}
         for oid, val in admin_rows:
-            parts = oid.split(".")
-            group_idx = int(parts[-2])
-            port_idx = int(parts[-1])
+            # pethPsePortTable index is "<group>.<port>"; only split off the tail.
+            _, group_idx, port_idx = oid.rsplit(".", 2)
+            group_idx, port_idx = int(group_idx), int(port_idx)
             v = _parse_numeric(val)
             if v is not None:
                 admin_map[(group_idx, port_idx)] = int(v)
 
         priority_map = {}
         for oid, val in priority_rows:
-            parts = oid.split(".")
-            group_idx = int(parts[-2])
-            port_idx = int(parts[-1])
+            _, group_idx, port_idx = oid.rsplit(".", 2)
+            group_idx, port_idx = int(group_idx), int(port_idx)
             v = _parse_numeric(val)
             if v is not None:
                 priority_map[(group_idx, port_idx)] = int(v)
@@ -5,9 +5,9 @@ if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
 try:
-    from ..helpers import _parse_numeric
+    from ..helpers import _oid_index, _parse_numeric
 except ImportError:
-    from custom_components.snmp_switch_manager.helpers import _parse_numeric
+    from custom_components.snmp_switch_manager.helpers import _oid_index, _parse_numeric
 
 async def poll_power(client: SwitchSnmpClient, vendor: str) -> None:
     """Poll Power metrics."""
@@ -20,7 +20,7 @@ async def poll_power(client: SwitchSnmpClient, vendor: str) -> None:
             rows = await client._async_walk(oid)
             for o, val in rows:
                 try:
-                    env_idx = int(str(o).split(".")[-1])
+                    env_idx = _oid_index(o)
                 except Exception:
                     continue
                 mw = _parse_numeric(val)
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
-from ..helpers import _parse_numeric, decode_label
+from ..helpers import _oid_index, _parse_numeric, decode_label
 
 
 async def _walk_labels(client: "SwitchSnmpClient", oid: str) -> dict[int, str]:
@@ -13,7 +13,7 @@ async def _walk_labels(client: "SwitchSnmpClient", oid: str) -> dict[int, str]:
     labels: dict[int, str] = {}
     for lo, lval in await client._async_walk(oid):
         try:
-            lidx = int(str(lo).split(".")[-1])
+            lidx = _oid_index(lo)
         except Exception:
             continue
         s = decode_label(lval).strip()
@@ -39,7 +39,7 @@ async def poll_psu(client: "SwitchSnmpClient", vendor: str) -> None:
 
             for o, val in await client._async_walk(oid_status):
                 try:
-                    idx = int(str(o).split(".")[-1])
+                    idx = _oid_index(o)
                 except Exception:
                     continue
                 if filter_str and filter_str not in physical_names.get(idx, ""):
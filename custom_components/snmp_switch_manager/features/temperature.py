@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from ..snmp import SwitchSnmpClient
 
-from ..helpers import _parse_numeric, decode_label
+from ..helpers import _oid_index, _parse_numeric, decode_label
 
 
 async def poll_temperature(client: "SwitchSnmpClient", vendor: str) -> None:
@@ -22,7 +22,7 @@ async def poll_temperature(client: "SwitchSnmpClient", vendor: str) -> None:
             if item.get("method") == "walk" and oid:
                 for o, val in await client._async_walk(oid):
                     try:
-                        idx = int(str(o).split(".")[-1])
+                        idx = _oid_index(o)
                     except Exception:
                         continue
                     n = _parse_numeric(val)
@@ -33,7 +33,7 @@ async def poll_temperature(client: "SwitchSnmpClient", vendor: str) -> None:
                     temp_labels: dict[int, str] = {}
                     for lo, lval in await client._async_walk(item["oid_label"]):
                         try:
-                            lidx = int(str(lo).split(".")[-1])
+                            lidx = _oid_index(lo)
                         except Exception:
                             continue
                         s = decode_label(lval).strip()
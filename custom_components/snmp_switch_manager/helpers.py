@@ -1,9 +1,11 @@
 """SNMP Switch Manager helper utilities."""
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import re
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 
 from .const import (
     CONF_OVERRIDE_COMMUNITY,
@@ -84,15 +86,22 @@ def get_snmp_connection_settings(entry_data: dict[str, Any], options: dict[str,
 
 # ---------- interface naming ----------
 
+# Fallback abbreviation tables, used when the database provides none. Each is
+# scanned in order and the first match wins.
+_DEFAULT_ABBR_PREFIXES = {"gi": "Gi", "te": "Te", "tw": "Tw", "fa": "Fa", "fi": "Fi", "hu": "Hu", "lo": "Lo", "vl": "Vl"}
+_DEFAULT_ABBR_STARTSWITH = {"po": "Po", "port-channel": "Po", "portchannel": "Po"}
+_DEFAULT_ABBR_CONTAINS = {"100g": "Hu", "10g": "Te", "20g": "Tw"}
+
+
 def _abbr_from_speed_or_name(name: str, db: dict | None = None) -> str:
     n = (name or "").lower()
 
     # Load mapping configuration from dynamic database, falling back to static local dicts
     abbrev_config = (db or {}).get("abbreviations") if db else None
     if not abbrev_config:
-        prefixes = {"gi": "Gi", "te": "Te", "tw": "Tw", "fa": "Fa", "fi": "Fi", "hu": "Hu", "lo": "Lo", "vl": "Vl"}
-        startswith = {"po": "Po", "port-channel": "Po", "portchannel": "Po"}
-        contains = {"100g": "Hu", "10g": "Te", "20g": "Tw"}
+        prefixes = _DEFAULT_ABBR_PREFIXES
+        startswith = _DEFAULT_ABBR_STARTSWITH
+        contains = _DEFAULT_ABBR_CONTAINS
         default = "Gi"
     else:
         prefixes = abbrev_config.get("prefixes", {})
@@ -129,16 +138,56 @@ def format_interface_name(
     return rn
 
 
+# ---------- interface name filters ----------
+
+def compile_name_filter(
+    starts: tuple[str, ...] | list[str],
+    contains: tuple[str, ...] | list[str],
+    ends: tuple[str, ...] | list[str],
+) -> Optional[re.Pattern[str]]:
+    """Compile starts-with/contains/ends-with rules into one regex.
+
+    Rules and names are expected to be lower-cased already. Returns None when
+    there are no rules so callers can skip matching entirely.
+    """
+    alternatives: list[str] = []
+    if starts:
+        alternatives.append("^(?:" + "|".join(re.escape(s) for s in starts) + ")")
+    if contains:
+        alternatives.append("(?:" + "|".join(re.escape(s) for s in contains) + ")")
+    if ends:
+        alternatives.append("(?:" + "|".join(re.escape(s) for s in ends) + ")$")
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives))
+
+
 # ---------- IP / CIDR ----------
 
-def ip_to_cidr(ip: str, mask: str) -> Optional[str]:
+@lru_cache(maxsize=64)
+def netmask_to_prefix(mask: Optional[str]) -> Optional[int]:
+    """Return the prefix length of a dotted-quad netmask, or None if it isn't one."""
     try:
-        mask_parts = [int(p) for p in mask.split(".") if p.isdigit()]
-        if len(mask_parts) == 4:
-            prefix_len = sum(bin(x).count("1") for x in mask_parts)
-            return f"{ip}/{prefix_len}"
-    except Exception:
-        pass
+        a, b, c, d = (int(p) for p in mask.split("."))
+    except (AttributeError, ValueError):
+        return None
+    if (a | b | c | d) & ~0xFF:
+        return None
+    n = (a << 24) | (b << 16) | (c << 8) | d
+    # A valid netmask is a run of ones followed by zeros: its complement + 1
+    # must be a power of two.
+    inv = n ^ 0xFFFFFFFF
+    if inv & (inv + 1):
+        return None
+    return n.bit_count()
+
+
+@lru_cache(maxsize=1024)
+def ip_to_cidr(ip: str, mask: str) -> Optional[str]:
+    bits = netmask_to_prefix(mask)
+    if bits is not None:
+        return f"{ip}/{bits}"
+    # Not a plain netmask (e.g. a hostmask); let ipaddress interpret or reject it.
     try:
         net = ipaddress.IPv4Network((ip, mask), strict=False)
         return f"{ip}/{net.prefixlen}"
@@ -219,7 +268,16 @@ def classify_port_type(
     return "unknown"
 
 
-# ---------- pfSense sysDescr parsing ----------
+# ---------- sysDescr parsing ----------
+
+_RE_PFSENSE_FW = re.compile(r"\b(\d+\.\d+\.\d+-(?:RELEASE|RC\d*|BETA\d*|DEVELOPMENT))\b", re.IGNORECASE)
+_RE_PFSENSE_MODEL = re.compile(r"\b(FreeBSD\s+[^,]+)$")
+# Linear replacement for r"\b(FreeBSD\s+\S+(?:\s+\S+)*)\b": take the rest of
+# the line and trim trailing non-word characters in Python instead of letting
+# the engine backtrack through the nested repetition to find the final \b.
+_RE_PFSENSE_MODEL_LOOSE = re.compile(r"\bFreeBSD\s+\S[^\r\n]*")
+_PFSENSE_ARCH_SUFFIXES = frozenset({"amd64", "i386", "x86_64", "arm64", "aarch64"})
+
 
 def parse_pfsense_sysdescr(sys_descr: str) -> dict[str, str | None]:
     """Parse pfSense sysDescr into manufacturer/model/firmware.
@@ -236,40 +294,92 @@ def parse_pfsense_sysdescr(sys_descr: str) -> dict[str, str | None]:
     manufacturer = "pfSense"
 
     fw = None
-    m = re.search(r"\b(\d+\.\d+\.\d+-(?:RELEASE|RC\d*|BETA\d*|DEVELOPMENT))\b", sd, flags=re.IGNORECASE)
+    m = _RE_PFSENSE_FW.search(sd)
     if m:
         fw = m.group(1)
 
     model = None
-    m2 = re.search(r"\b(FreeBSD\s+[^,]+)$", sd)
+    m2 = _RE_PFSENSE_MODEL.search(sd)
     if m2:
         model = m2.group(1).strip()
     else:
-        m3 = re.search(r"\b(FreeBSD\s+\S+(?:\s+\S+)*)\b", sd)
+        m3 = _RE_PFSENSE_MODEL_LOOSE.search(sd)
         if m3:
-            model = m3.group(1).strip()
+            model = m3.group(0)
+            end = len(model)
+            while end and not (model[end - 1].isalnum() or model[end - 1] == "_"):
+                end -= 1
+            model = model[:end]
 
     if model:
         toks = model.split()
-        if toks and toks[-1].lower() in {"amd64", "i386", "x86_64", "arm64", "aarch64"}:
+        if toks and toks[-1].lower() in _PFSENSE_ARCH_SUFFIXES:
             model = " ".join(toks[:-1]).strip() or model
 
     return {"manufacturer": manufacturer, "model": model, "firmware": fw}
 
 
+class SysDescrInfo(NamedTuple):
+    """Manufacturer/model/firmware parsed from a sysDescr string."""
+
+    manufacturer: Optional[str]
+    model: Optional[str]
+    firmware: Optional[str]
+    is_pfsense: bool
+
+
+@lru_cache(maxsize=32)
+def parse_system_info(sys_descr: str, model_hint: Optional[str] = None) -> SysDescrInfo:
+    """Parse manufacturer/model/firmware from sysDescr.
+
+    Single entry point for sysDescr parsing. sysDescr rarely changes, so
+    results are cached per (sysDescr, model hint) pair.
+    """
+    sd = (sys_descr or "").strip()
+    pfs = parse_pfsense_sysdescr(sd)
+    if pfs.get("manufacturer"):
+        return SysDescrInfo(pfs["manufacturer"], pfs["model"], pfs["firmware"], True)
+    if not sd:
+        return SysDescrInfo(None, None, None, False)
+
+    # Generic "<manufacturer> <model>, <firmware>, ..." layout
+    parts = [p.strip() for p in sd.split(",")]
+    firmware = parts[1] if len(parts) >= 2 else None
+    head = parts[0]
+    if model_hint and model_hint in head:
+        manufacturer = head.replace(model_hint, "").strip() or None
+    else:
+        toks = head.split()
+        manufacturer = " ".join(toks[:-1]) if len(toks) > 1 else None
+    return SysDescrInfo(manufacturer, None, firmware or None, False)
+
+
 # ---------- uptime ----------
 
+_TICKS_PER_SECOND = 100
+_SECONDS_PER_DAY = 86_400
+_SECONDS_PER_HOUR = 3_600
+_SECONDS_PER_MINUTE = 60
+
+
+@lru_cache(maxsize=8)
+def _uptime_str(ticks: int) -> str:
+    """Format integer sysUpTime ticks; cached since every reader sees the same value."""
+    d, r = divmod(ticks // _TICKS_PER_SECOND, _SECONDS_PER_DAY)
+    h, r = divmod(r, _SECONDS_PER_HOUR)
+    m, s = divmod(r, _SECONDS_PER_MINUTE)
+    return "%dd %dh %dm %ds" % (d, h, m, s)
+
+
 def uptime_human(ticks: Any) -> str:
     """Convert sysUpTime (hundredths of seconds) to human-readable string."""
+    if isinstance(ticks, int):
+        return _uptime_str(ticks)
     try:
         t = int(ticks)
-        sec = t // 100
-        d, r = divmod(sec, 86400)
-        h, r = divmod(r, 3600)
-        m, s = divmod(r, 60)
-        return f"{d}d {h}h {m}m {s}s"
     except Exception:
         return str(ticks) if ticks is not None else "Unknown"
+    return _uptime_str(t)
 
 
 # ---------- vendor interface rules ----------
@@ -295,6 +405,16 @@ LOCAL_INTERFACE_FILTERS = _load_local_interface_filters()
 
 
 
+@lru_cache(maxsize=512)
+def _lower_needles(values: tuple) -> tuple[str, ...]:
+    return tuple(str(v).lower() for v in values)
+
+
+def _needles(val: Any) -> tuple[str, ...]:
+    """Lower-cased match values of a filter condition, as a tuple for str.startswith/endswith."""
+    return _lower_needles(tuple(val) if isinstance(val, list) else (val,))
+
+
 def _match_condition(
     cond: dict,
     normalized_name: str,
@@ -307,15 +427,15 @@ def _match_condition(
     match_val = cond.get("match_value")
     
     if match_val is not None:
-        vals = [str(v).lower() for v in match_val] if isinstance(match_val, list) else [str(match_val).lower()]
+        vals = _needles(match_val)
         if match_type == "equals":
-            if not any(normalized_name == v for v in vals):
+            if normalized_name not in vals:
                 return False
         elif match_type == "starts_with":
-            if not any(normalized_name.startswith(v) for v in vals):
+            if not normalized_name.startswith(vals):
                 return False
         elif match_type == "ends_with":
-            if not any(normalized_name.endswith(v) for v in vals):
+            if not normalized_name.endswith(vals):
                 return False
         elif match_type == "is_digit":
             if not normalized_name.isdigit():
@@ -329,20 +449,17 @@ def _match_condition(
 
     req_contains = cond.get("require_contains")
     if req_contains:
-        reqs = req_contains if isinstance(req_contains, list) else [req_contains]
-        if not all(r.lower() in normalized_name for r in reqs):
+        if not all(r in normalized_name for r in _needles(req_contains)):
             return False
             
     ex_contains = cond.get("exclude_contains")
     if ex_contains:
-        exs = ex_contains if isinstance(ex_contains, list) else [ex_contains]
-        if any(e.lower() in normalized_name for e in exs):
+        if any(e in normalized_name for e in _needles(ex_contains)):
             return False
             
     ex_ends = cond.get("exclude_ends_with")
     if ex_ends:
-        exs = ex_ends if isinstance(ex_ends, list) else [ex_ends]
-        if any(normalized_name.endswith(e.lower()) for e in exs):
+        if normalized_name.endswith(_needles(ex_ends)):
             return False
 
     req_ip = cond.get("require_ip")
@@ -386,23 +503,15 @@ def _match_condition(
     return True
 
 
-def check_interface_filter_rules(
+def _active_filter_rules(
     *,
-    normalized_name: str,
-    raw_name: str,
-    admin: int | None,
-    oper: int | None,
-    has_ip: bool,
     vendor: str,
-    manufacturer: str = "",
-    sys_descr: str = "",
+    manufacturer: str,
+    sys_descr: str,
     disabled_vendor_filter_ids: set[str],
-    classification_db: dict | None = None,
-) -> tuple[bool, str]:
-    """Check if an interface is included based on dynamic database rules.
-
-    Returns (include, modified_raw_name).
-    """
+    classification_db: dict | None,
+) -> tuple[list[dict], bool]:
+    """Return (rules that apply to this device, whether any of them is an include rule)."""
     db_rules = None
     if classification_db:
         if "interface_filters" in classification_db:
@@ -447,6 +556,34 @@ def check_interface_filter_rules(
             if rule.get("rule_type") == "include":
                 has_include_rule = True
 
+    return active_rules, has_include_rule
+
+
+def check_interface_filter_rules(
+    *,
+    normalized_name: str,
+    raw_name: str,
+    admin: int | None,
+    oper: int | None,
+    has_ip: bool,
+    vendor: str,
+    manufacturer: str = "",
+    sys_descr: str = "",
+    disabled_vendor_filter_ids: set[str],
+    classification_db: dict | None = None,
+) -> tuple[bool, str]:
+    """Check if an interface is included based on dynamic database rules.
+
+    Returns (include, modified_raw_name).
+    """
+    active_rules, has_include_rule = _active_filter_rules(
+        vendor=vendor,
+        manufacturer=manufacturer,
+        sys_descr=sys_descr,
+        disabled_vendor_filter_ids=disabled_vendor_filter_ids,
+        classification_db=classification_db,
+    )
+
     default_include = not has_include_rule
     include = default_include
 
@@ -476,12 +613,64 @@ def check_interface_filter_rules(
     return include, raw_name
 
 
+# Condition keys that depend on live port state rather than the interface name.
+_DYNAMIC_FILTER_KEYS = ("admin_in", "oper_in", "oper_not_equal", "require_ip")
+
+
+def static_exclude_conditions(
+    *,
+    vendor: str,
+    manufacturer: str = "",
+    sys_descr: str = "",
+    disabled_vendor_filter_ids: set[str],
+    classification_db: dict | None = None,
+) -> list[dict]:
+    """Return conditions of active exclude rules that only look at the interface name.
+
+    An interface matching one of these is never turned into an entity, whatever
+    its admin/oper state, so pollers can skip it entirely.
+    """
+    active_rules, _ = _active_filter_rules(
+        vendor=vendor,
+        manufacturer=manufacturer,
+        sys_descr=sys_descr,
+        disabled_vendor_filter_ids=disabled_vendor_filter_ids,
+        classification_db=classification_db,
+    )
+    out: list[dict] = []
+    for rule in active_rules:
+        if rule.get("rule_type") != "exclude":
+            continue
+        conditions = rule.get("conditions") or [rule]
+        if any(cond.get(key) is not None for cond in conditions for key in _DYNAMIC_FILTER_KEYS):
+            continue
+        out.extend(conditions)
+    return out
+
+
+def matches_static_exclude(normalized_name: str, conditions: list[dict]) -> bool:
+    """Return True if a name matches any condition from static_exclude_conditions."""
+    return any(
+        _match_condition(cond, normalized_name, normalized_name, None, None, False)
+        for cond in conditions
+    )
+
+
 
 
 # ---------- SNMP value parsing ----------
 
+def _oid_index(oid: str) -> int:
+    """Return the last sub-identifier of a dotted OID (the row index of single-index tables)."""
+    return int(oid[oid.rfind(".") + 1 :])
+
+
 def _parse_numeric(val) -> Optional[int]:
     """Parse an SNMP value to int, returning None on failure."""
+    if isinstance(val, int):
+        return val
+    if isinstance(val, str) and val.isdecimal():
+        return int(val)
     try:
         return int(val)
     except (TypeError, ValueError):
@@ -588,6 +777,42 @@ def _make_settings(
     return settings
 
 
+# The config flow probes the same device several times in a row (connection
+# test, then sysName); keep a probe client per host so its engine and
+# transport are built once rather than per call. Flows release their host's
+# client when they finish or are aborted.
+_probe_clients: dict[str, tuple[str, Any]] = {}
+_probe_lock = asyncio.Lock()
+
+
+async def _get_probe_client(hass: Any, host: str, settings: dict[str, Any]) -> Any:
+    """Return a cached SwitchSnmpClient for ``host``/``settings``."""
+    from .snmp import SwitchSnmpClient
+
+    key = repr(sorted(settings.items()))
+    async with _probe_lock:
+        cached = _probe_clients.get(host)
+        if cached is not None:
+            cached_key, client = cached
+            if cached_key == key:
+                return client
+            # Same host, new credentials (e.g. the user corrected a typo).
+            del _probe_clients[host]
+            await client.async_close()
+
+        client = SwitchSnmpClient(hass, host, settings)
+        _probe_clients[host] = (key, client)
+        return client
+
+
+async def async_release_probe_client(host: str) -> None:
+    """Close the cached probe client for ``host``, if any."""
+    async with _probe_lock:
+        cached = _probe_clients.pop(host, None)
+        if cached is not None:
+            await cached[1].async_close()
+
+
 async def test_connection(
     hass: Any,
     host: str,
@@ -601,9 +826,8 @@ async def test_connection(
     Backwards compatible with the original v2c signature, but also supports
     passing a pre-merged settings dict for SNMPv3.
     """
-    from .snmp import SwitchSnmpClient
     from .const import OID_sysName
-    client = SwitchSnmpClient(hass, host, _make_settings(host, community, port, snmp_settings))
+    client = await _get_probe_client(hass, host, _make_settings(host, community, port, snmp_settings))
     return await client._async_get_one(OID_sysName) is not None
 
 
@@ -616,7 +840,6 @@ async def get_sysname(
     snmp_settings: Optional[dict[str, Any]] = None,
 ) -> Optional[str]:
     """Return sysName from the device, or None on failure."""
-    from .snmp import SwitchSnmpClient
     from .const import OID_sysName
-    client = SwitchSnmpClient(hass, host, _make_settings(host, community, port, snmp_settings))
+    client = await _get_probe_client(hass, host, _make_settings(host, community, port, snmp_settings))
     return await client._async_get_one(OID_sysName)
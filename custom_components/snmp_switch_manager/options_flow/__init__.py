@@ -16,6 +16,16 @@ from ..const import (
     DEFAULT_UPTIME_POLL_INTERVAL,
     MIN_UPTIME_POLL_INTERVAL,
     MAX_UPTIME_POLL_INTERVAL,
+    CONF_SNMP_TIMEOUT,
+    DEFAULT_SNMP_TIMEOUT,
+    MIN_SNMP_TIMEOUT,
+    MAX_SNMP_TIMEOUT,
+    CONF_SNMP_RETRIES,
+    DEFAULT_SNMP_RETRIES,
+    MAX_SNMP_RETRIES,
+    CONF_MAX_CONCURRENT_WALKS,
+    DEFAULT_MAX_CONCURRENT_WALKS,
+    MAX_MAX_CONCURRENT_WALKS,
     CONF_SNMP_VERSION,
     SNMP_VERSION_V2C,
     SNMP_VERSION_V3,
@@ -381,6 +391,36 @@ class OptionsFlowHandler(
             except Exception:
                 errors[CONF_UPTIME_POLL_INTERVAL] = "invalid_uptime_interval"
 
+            timeout_raw = str(user_input.get(CONF_SNMP_TIMEOUT, "")).strip()
+            try:
+                timeout_val = float(timeout_raw)
+                if timeout_val < MIN_SNMP_TIMEOUT or timeout_val > MAX_SNMP_TIMEOUT:
+                    raise ValueError("out_of_range")
+                if timeout_val != float(self._options.get(CONF_SNMP_TIMEOUT, DEFAULT_SNMP_TIMEOUT)):
+                    self._options[CONF_SNMP_TIMEOUT] = timeout_val
+            except Exception:
+                errors[CONF_SNMP_TIMEOUT] = "invalid_snmp_timeout"
+
+            retries_raw = str(user_input.get(CONF_SNMP_RETRIES, "")).strip()
+            try:
+                retries_val = int(retries_raw)
+                if retries_val < 0 or retries_val > MAX_SNMP_RETRIES:
+                    raise ValueError("out_of_range")
+                if retries_val != int(self._options.get(CONF_SNMP_RETRIES, DEFAULT_SNMP_RETRIES)):
+                    self._options[CONF_SNMP_RETRIES] = retries_val
+            except Exception:
+                errors[CONF_SNMP_RETRIES] = "invalid_snmp_retries"
+
+            walks_raw = str(user_input.get(CONF_MAX_CONCURRENT_WALKS, "")).strip()
+            try:
+                walks_val = int(walks_raw)
+                if walks_val < 1 or walks_val > MAX_MAX_CONCURRENT_WALKS:
+                    raise ValueError("out_of_range")
+                if walks_val != int(self._options.get(CONF_MAX_CONCURRENT_WALKS, DEFAULT_MAX_CONCURRENT_WALKS)):
+                    self._options[CONF_MAX_CONCURRENT_WALKS] = walks_val
+            except Exception:
+                errors[CONF_MAX_CONCURRENT_WALKS] = "invalid_max_concurrent_walks"
+
             if not errors:
                 self._apply_options()
                 return await self.async_step_init()
@@ -411,6 +451,18 @@ class OptionsFlowHandler(
                     CONF_UPTIME_POLL_INTERVAL,
                     default=str(self._options.get(CONF_UPTIME_POLL_INTERVAL, DEFAULT_UPTIME_POLL_INTERVAL)),
                 ): str,
+                vol.Optional(
+                    CONF_SNMP_TIMEOUT,
+                    default=str(self._options.get(CONF_SNMP_TIMEOUT, DEFAULT_SNMP_TIMEOUT)),
+                ): str,
+                vol.Optional(
+                    CONF_SNMP_RETRIES,
+                    default=str(self._options.get(CONF_SNMP_RETRIES, DEFAULT_SNMP_RETRIES)),
+                ): str,
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_WALKS,
+                    default=str(self._options.get(CONF_MAX_CONCURRENT_WALKS, DEFAULT_MAX_CONCURRENT_WALKS)),
+                ): str,
                 vol.Optional(
                     CONF_SNMPV3_USERNAME,
                     default=str(self._options.get(CONF_SNMPV3_USERNAME, self._entry.data.get(CONF_SNMPV3_USERNAME, ""))),
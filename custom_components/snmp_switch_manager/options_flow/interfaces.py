@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+
 import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
@@ -19,12 +21,15 @@ from ..const import (
 )
 
 
+_RE_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_RE_SLUG_SEP = re.compile(r"[-\s]+")
+
+
 def _slugify(text: str) -> str:
     """Slugify display label into a unique rule ID."""
-    import re
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "_", text)
+    text = _RE_SLUG_STRIP.sub("", text)
+    text = _RE_SLUG_SEP.sub("_", text)
     return text
 
 
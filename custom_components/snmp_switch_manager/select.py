@@ -58,6 +58,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     device_info = DeviceInfo(identifiers=identifiers, name=hostname)
 
     desired_poe_indexes = set()
+    classification_db = client._database.get("interface_classification") if hasattr(client, "_database") else None
 
     for idx, port_info in poe_ports.items():
         group_idx = port_info.get("group")
@@ -82,8 +83,9 @@ async def async_setup_entry(hass, entry, async_add_entities):
         except Exception:
             pass
 
-        db = client._database.get("interface_classification") if hasattr(client, "_database") else None
-        display = format_interface_name(raw_name, unit=unit, slot=slot, port=port, classification_db=db)
+        display = format_interface_name(
+            raw_name, unit=unit, slot=slot, port=port, classification_db=classification_db
+        )
 
         entities.append(
             PoePortPrioritySelect(
@@ -30,7 +30,7 @@ from ..const import (
     ENV_MODE_SENSORS,
 )
 from ..snmp import SwitchSnmpClient
-from ..helpers import check_interface_filter_rules, uptime_human
+from ..helpers import check_interface_filter_rules, compile_name_filter, uptime_human
 
 from .bandwidth import BandwidthRateSensor, BandwidthTotalSensor
 from .environmental import (
@@ -125,8 +125,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         iftable = coordinator.data.get("ifTable", {}) or {}
         allowed_if_indexes: set[int] = set()
 
-        ip_index = client.cache.get("ipIndex", {}) or {}
-        ip_mask = client.cache.get("ipMask", {}) or {}
+        ip_cidr = client.cache.get("ipCidr", {}) or {}
         disabled_vendor_filter_ids = set(entry.options.get("disabled_vendor_filter_rule_ids", []) or [])
 
         vendor = client.cache.get("vendor", "Unknown")
@@ -134,28 +133,6 @@ async def async_setup_entry(hass, entry, async_add_entities):
         sys_descr = client.cache.get("sysDescr") or ""
         db_filters = client._database if hasattr(client, "_database") else None
 
-        ip_by_ifindex = {}
-        for ip, idx in ip_index.items():
-            try:
-                ip_by_ifindex[int(idx)] = ip
-            except Exception:
-                pass
-
-        def _ip_for_index(if_index: int) -> str | None:
-            ip = ip_by_ifindex.get(int(if_index))
-            if not ip:
-                return None
-            mask = str(ip_mask.get(ip) or "")
-            if mask:
-                try:
-                    parts = [int(p) for p in mask.split(".") if p.isdigit()]
-                    if len(parts) == 4:
-                        bits = sum(bin(p).count("1") for p in parts)
-                        return f"{ip}/{bits}"
-                except Exception:
-                    pass
-            return str(ip)
-
         for idx_i, row in (iftable or {}).items():
             try:
                 idx_i = int(idx_i)
@@ -168,7 +145,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
                 continue
 
             lower = raw_name.lower()
-            ip_str = _ip_for_index(idx_i)
+            ip_str = ip_cidr.get(idx_i)
 
             is_port_channel = lower.startswith("po") or lower.startswith("port-channel") or lower.startswith("link aggregate")
             if is_port_channel and not (ip_str or alias):
@@ -210,16 +187,8 @@ async def async_setup_entry(hass, entry, async_add_entities):
         exclude_contains = _clean_list(CONF_BW_EXCLUDE_CONTAINS)
         exclude_ends = _clean_list(CONF_BW_EXCLUDE_ENDS_WITH)
 
-        def _matches_any(name_l: str, starts: tuple[str, ...], contains: tuple[str, ...], ends: tuple[str, ...]) -> bool:
-            if starts and name_l.startswith(starts):
-                return True
-            if ends and name_l.endswith(ends):
-                return True
-            if contains:
-                for x in contains:
-                    if x in name_l:
-                        return True
-            return False
+        include_re = compile_name_filter(include_starts, include_contains, include_ends)
+        exclude_re = compile_name_filter(exclude_starts, exclude_contains, exclude_ends)
 
         selected_indexes: list[int] = []
         for if_index, row in iftable.items():
@@ -234,12 +203,9 @@ async def async_setup_entry(hass, entry, async_add_entities):
             if not raw_name:
                 continue
             nl = raw_name.lower()
-            include_hit = _matches_any(nl, include_starts, include_contains, include_ends)
-            exclude_hit = _matches_any(nl, exclude_starts, exclude_contains, exclude_ends)
-
-            if (include_starts or include_contains or include_ends) and not include_hit:
+            if include_re is not None and include_re.search(nl) is None:
                 continue
-            if exclude_hit:
+            if exclude_re is not None and exclude_re.search(nl):
                 continue
 
             selected_indexes.append(idx_i)
@@ -362,7 +328,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
         fan_rpm = coord_data.get("env_fans_rpm") or {}
         fan_status = coord_data.get("env_fans_status") or {}
-        fan_indices = sorted({int(i) for i in list(fan_rpm.keys()) + list(fan_status.keys())})
+        fan_indices = sorted({int(i) for i in (*fan_rpm, *fan_status)})
         for idx in fan_indices:
             entities.append(EnvironmentFanRpmSensor(coordinator, entry, idx, device_info, host_label))
             entities.append(EnvironmentFanStatusSensor(coordinator, entry, device_info, host_label, idx))
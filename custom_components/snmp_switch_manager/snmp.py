@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import time
 import logging
 import os
 import json
-from typing import Any, Dict, Optional, List
+import re
+from typing import Any, AsyncIterator, Dict, Optional, List, Sequence
 
 from homeassistant.core import HomeAssistant
 
 from .features.cpu import poll_cpu
 from .features.memory import poll_memory
-from .features.interfaces import poll_interfaces
-from .features.ipv4 import poll_ipv4
+from .features.interfaces import poll_if_aliases, poll_interfaces
+from .features.ipv4 import _attach_ipv4_to_interfaces, poll_ipv4
 from .features.power import poll_power
 from .features.fans import poll_fans
 from .features.psu import poll_psu
@@ -21,17 +23,21 @@ from .features.entity_sensor import poll_entity_sensor_fallback
 from .features.bandwidth import poll_bandwidth
 from .features.poe import poll_poe
 from .features.h3c import poll_h3c_environment
-from .features.engine import ensure_engine
+from .features.engine import ensure_engine, release_engine
 from .features.device_info import initialize_device_info, refresh_device_info
-from .features.auth import build_auth_data
+from .features.auth import build_auth_data, engine_key
+from .helpers import _parse_numeric, compile_name_filter, matches_static_exclude, static_exclude_conditions
 
 from .snmp_compat import (
     UdpTransportTarget,
     ContextData,
     _do_get_one,
-    _do_next_walk,
-    _do_set_alias,
-    _do_set_admin_status,
+    _do_get_many,
+    _do_bulk_walk,
+    _do_bulk_walk_columns,
+    _iter_bulk_walk_columns,
+    _do_set_aliases,
+    _do_set_admin_statuses,
     _do_set_poe_admin,
     _do_set_poe_priority,
     _do_set_system_string,
@@ -40,6 +46,16 @@ from .snmp_compat import (
 
 # Canonical OIDs from const.py (original repo)
 from .const import (
+    DEFAULT_BULK_MAX_REPETITIONS,
+    DEFAULT_MAX_CONCURRENT_WALKS,
+    DEFAULT_SNMP_RETRIES,
+    DEFAULT_SNMP_TIMEOUT,
+    DEFAULT_IF_INDEX_CACHE_TTL,
+    DEFAULT_TARGET_RESOLVE_TTL,
+    DEFAULT_STATIC_REFRESH_INTERVAL,
+    DEFAULT_ALIAS_REFRESH_INTERVAL,
+    DEFAULT_IPV4_EMPTY_POLLS,
+    DEFAULT_IPV4_EMPTY_POLL_INTERVAL,
     OID_sysDescr,
     OID_sysName,
     OID_sysUpTime,
@@ -51,6 +67,13 @@ from .const import (
     CONF_BW_EXCLUDE_STARTS_WITH,
     CONF_BW_EXCLUDE_CONTAINS,
     CONF_BW_EXCLUDE_ENDS_WITH,
+    CONF_INCLUDE_STARTS_WITH,
+    CONF_INCLUDE_CONTAINS,
+    CONF_INCLUDE_ENDS_WITH,
+    CONF_EXCLUDE_STARTS_WITH,
+    CONF_EXCLUDE_CONTAINS,
+    CONF_EXCLUDE_ENDS_WITH,
+    CONF_DISABLED_VENDOR_FILTER_RULE_IDS,
     CONF_ENV_ENABLE,
     CONF_ENV_MODE,
     CONF_ENV_POLL_INTERVAL,
@@ -60,6 +83,17 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _jittered(interval: float) -> float:
+    """Return ``interval`` spread by +/-10%."""
+    return interval * random.uniform(0.9, 1.1)
+
+
+def _consume_task_exception(task: asyncio.Task) -> None:
+    """Mark a batched-write failure as retrieved when every caller was cancelled."""
+    if not task.cancelled():
+        task.exception()
+
 # ---------- client ----------
 
 class SwitchSnmpClient:
@@ -75,6 +109,11 @@ class SwitchSnmpClient:
         poe_options: Optional[Dict[str, Any]] = None,
         env_options: Optional[Dict[str, Any]] = None,
         feature_overrides: Optional[Dict[str, Any]] = None,
+        interface_options: Optional[Dict[str, Any]] = None,
+        max_repetitions: int = DEFAULT_BULK_MAX_REPETITIONS,
+        timeout: float = DEFAULT_SNMP_TIMEOUT,
+        retries: int = DEFAULT_SNMP_RETRIES,
+        max_concurrent_walks: int = DEFAULT_MAX_CONCURRENT_WALKS,
     ) -> None:
         self.hass = hass
         self.host = host
@@ -97,6 +136,27 @@ class SwitchSnmpClient:
         self._bw_exclude_contains = _clean_list(CONF_BW_EXCLUDE_CONTAINS)
         self._bw_exclude_ends = _clean_list(CONF_BW_EXCLUDE_ENDS_WITH)
 
+        # Interface include/exclude rules; interfaces they drop never become
+        # entities, so their dynamic columns are not refreshed on each poll.
+        self._interface_options: Dict[str, Any] = dict(interface_options or {})
+
+        def _clean_if_list(key: str) -> tuple[str, ...]:
+            return tuple(str(s).strip().lower() for s in (self._interface_options.get(key, []) or []) if str(s).strip())
+
+        self._if_include_re = compile_name_filter(
+            _clean_if_list(CONF_INCLUDE_STARTS_WITH),
+            _clean_if_list(CONF_INCLUDE_CONTAINS),
+            _clean_if_list(CONF_INCLUDE_ENDS_WITH),
+        )
+        self._if_exclude_re = compile_name_filter(
+            _clean_if_list(CONF_EXCLUDE_STARTS_WITH),
+            _clean_if_list(CONF_EXCLUDE_CONTAINS),
+            _clean_if_list(CONF_EXCLUDE_ENDS_WITH),
+        )
+        # Name-only vendor exclude rules, resolved once the vendor is known.
+        self._static_excludes_key: Optional[tuple] = None
+        self._static_excludes: list[dict] = []
+
         self._poe_options = poe_options or {}
         self._poe_last_poll: float = 0.0
 
@@ -106,13 +166,24 @@ class SwitchSnmpClient:
         self._bw_use_hc: Optional[bool] = None
         self._bw_last: Dict[int, Dict[str, Any]] = {}
 
+        # GETBULK max-repetitions used for every table walk.
+        self.max_repetitions = max(1, int(max_repetitions or DEFAULT_BULK_MAX_REPETITIONS))
+
         self.engine = None
         self.target = None
+        # The transport target resolves the host once when built; rebuild it
+        # periodically (and after connection errors) to pick up DNS changes.
+        self._target_built: float = 0.0
+        self._target_lock = asyncio.Lock()
+        # Bounds how many walks run against the device at once when pollers gather them.
+        self._walk_sem = asyncio.Semaphore(max(1, int(max_concurrent_walks)))
         self._target_args = ((host, self.port),)
-        self._target_kwargs = dict(timeout=1.5, retries=1)
+        self._target_kwargs = dict(timeout=float(timeout), retries=max(0, int(retries)))
 
         # SNMP auth/security model (v2c community or v3 USM)
         self.auth_data = self._build_auth_data(self._snmp_settings)
+        # Clients with the same key share one SnmpEngine (features/engine.py).
+        self.engine_key = engine_key(self._snmp_settings)
         self.context = ContextData()
 
         self.cache: Dict[str, Any] = {
@@ -122,6 +193,7 @@ class SwitchSnmpClient:
             "ifTable": {},
             "ipIndex": {},
             "ipMask": {},
+            "ipCidr": {},
             "manufacturer": None,
             "model": None,
             "firmware": None,
@@ -131,15 +203,45 @@ class SwitchSnmpClient:
         # Assistant, we throttle polling separately from the main coordinator.
         # These are used by async_poll().
         self._last_uptime_poll: float = 0.0
+        # System scalars the agent answered with noSuchObject/noSuchInstance; not re-polled.
+        self._unsupported_sys_oids: set[str] = set()
         self._uptime_poll_interval: float = 300.0
 
         # IPv4 address data rarely changes; throttle refreshes independently.
         self._last_ipv4_poll: float = 0.0
         self._ipv4_poll_interval: float = 300.0
+        # Pure L2 switches have no addresses to find; after a few empty polls
+        # the address tables are only re-probed on a much longer clock.
+        self._ipv4_empty_polls: int = 0
+
+        # Once the ifIndex set has been walked, dynamic polls GET the known
+        # instances directly until the TTL runs out or an instance goes missing.
+        self._last_if_index_walk: float = 0.0
+        self._if_index_ttl: float = float(DEFAULT_IF_INDEX_CACHE_TTL)
+        # Set when sysUpTime goes backwards: the agent restarted and may have
+        # renumbered its interfaces, so the static columns need a fresh walk.
+        self._static_refresh_due: bool = False
+        # Names/VLANs and aliases are re-walked on their own (jittered) clocks
+        # so many switches don't all regenerate on the same poll.
+        self._next_static_walk: float = 0.0
+        self._next_alias_walk: float = 0.0
+
+        # ifAdminStatus/ifAlias writes requested in the same event-loop pass
+        # (e.g. a service call targeting several ports) are sent as one SET PDU
+        # per column, keyed by the snmp_compat setter that writes them.
+        self._set_batches: Dict[Any, tuple[Dict[int, Any], asyncio.Task]] = {}
 
         # Vendor-specific firmware/model OIDs (CBS350, Zyxel, MikroTik) never
         # change at runtime; fetch once during async_initialize and skip on polls.
         self._vendor_oids_fetched: bool = False
+        # sysDescr that manufacturer/firmware were last derived from; cleared
+        # when the agent restarts (e.g. after a firmware upgrade).
+        self._device_info_sysdescr: Optional[str] = None
+
+    @property
+    def interface_filters(self) -> tuple[Optional[re.Pattern[str]], Optional[re.Pattern[str]]]:
+        """Compiled (include, exclude) interface name matchers from the entry options."""
+        return self._if_include_re, self._if_exclude_re
 
     def _load_database(self) -> None:
         """Load OID database from JSON files."""
@@ -219,6 +321,53 @@ class SwitchSnmpClient:
             v = v[1:]
         return v
 
+    def _if_indexes_fresh(self) -> bool:
+        """Return True while the walked ifIndex set can be polled with GETs."""
+        return (
+            self._last_if_index_walk > 0.0
+            and (time.monotonic() - self._last_if_index_walk) < self._if_index_ttl
+        )
+
+    def _static_vendor_excludes(self) -> list[dict]:
+        """Return the name-only vendor exclude conditions for this device (cached)."""
+        key = (self.cache.get("vendor"), self.cache.get("manufacturer"), self.cache.get("sysDescr"))
+        if key != self._static_excludes_key:
+            self._static_excludes_key = key
+            self._static_excludes = static_exclude_conditions(
+                vendor=key[0] or "Unknown",
+                manufacturer=key[1] or "",
+                sys_descr=key[2] or "",
+                disabled_vendor_filter_ids=set(self._interface_options.get(CONF_DISABLED_VENDOR_FILTER_RULE_IDS) or []),
+                classification_db=self._database or None,
+            )
+        return self._static_excludes
+
+    def _wanted_if_indexes(self) -> Optional[list[int]]:
+        """Return the ifIndexes that can become entities, or None for all.
+
+        Applies the user include/exclude rules plus vendor exclude rules that
+        only depend on the name (e.g. CPU pseudo-interfaces).
+        """
+        vendor_excludes = self._static_vendor_excludes()
+        if self._if_include_re is None and self._if_exclude_re is None and not vendor_excludes:
+            return None
+        if_table = self.cache.get("ifTable") or {}
+        wanted: list[int] = []
+        for idx, rec in if_table.items():
+            name = str(rec.get("display_name") or rec.get("name") or rec.get("descr") or f"if{idx}").strip().lower()
+            if self._if_exclude_re is not None and self._if_exclude_re.search(name):
+                continue
+            include_hit = self._if_include_re is not None and self._if_include_re.search(name) is not None
+            if self._if_include_re is not None and not include_hit:
+                continue
+            # A user include match overrides vendor filtering, as in switch setup.
+            if vendor_excludes and not include_hit and matches_static_exclude(name, vendor_excludes):
+                continue
+            wanted.append(idx)
+        if len(wanted) == len(if_table):
+            return None
+        return wanted
+
     @staticmethod
     def _build_auth_data(settings: Dict[str, Any]):
         """Build pysnmp authData object — delegates to features/auth.py."""
@@ -240,8 +389,52 @@ class SwitchSnmpClient:
         await ensure_engine(self)
 
     async def _ensure_target(self) -> None:
-        if self.target is None:
-            self.target = await UdpTransportTarget.create(*self._target_args, **self._target_kwargs)
+        if self.target is not None and (time.monotonic() - self._target_built) < DEFAULT_TARGET_RESOLVE_TTL:
+            return
+        async with self._target_lock:
+            if self.target is None or (time.monotonic() - self._target_built) >= DEFAULT_TARGET_RESOLVE_TTL:
+                self.target = await UdpTransportTarget.create(*self._target_args, **self._target_kwargs)
+                self._target_built = time.monotonic()
+
+    def _session_ready(self) -> bool:
+        """Return True when engine and target are built and the target is current."""
+        return (
+            self.engine is not None
+            and self.target is not None
+            and (time.monotonic() - self._target_built) < DEFAULT_TARGET_RESOLVE_TTL
+        )
+
+    async def _ensure_session(self) -> None:
+        # Fast path: every request calls this, and the session is almost always ready.
+        if self._session_ready():
+            return
+        await self._ensure_engine()
+        await self._ensure_target()
+
+    def _schedule_static_walks(self, now_mono: float) -> None:
+        """Schedule the next full static walk and alias refresh after one has run."""
+        self._next_static_walk = now_mono + _jittered(DEFAULT_STATIC_REFRESH_INTERVAL)
+        self._next_alias_walk = now_mono + _jittered(DEFAULT_ALIAS_REFRESH_INTERVAL)
+
+    async def _async_poll_ipv4(self, now_mono: float) -> None:
+        """Run the IPv4 poll and track consecutive polls that found no addresses."""
+        self._last_ipv4_poll = now_mono
+        if await poll_ipv4(self):
+            self._ipv4_empty_polls = 0
+        else:
+            self._ipv4_empty_polls += 1
+
+    def _ipv4_poll_due(self, now_mono: float) -> bool:
+        if self._last_ipv4_poll == 0.0:
+            return True
+        interval = self._ipv4_poll_interval
+        if self._ipv4_empty_polls >= DEFAULT_IPV4_EMPTY_POLLS:
+            interval = max(interval, float(DEFAULT_IPV4_EMPTY_POLL_INTERVAL))
+        return (now_mono - self._last_ipv4_poll) >= interval
+
+    def invalidate_target(self) -> None:
+        """Drop the transport target so the next request re-resolves the host."""
+        self.target = None
 
     # ---------- lifecycle / fetch ----------
 
@@ -253,21 +446,33 @@ class SwitchSnmpClient:
         """
         if self.engine is None:
             return
+        engine, self.engine, self.target = self.engine, None, None
+        # The engine is shared between clients; only the last one closes it.
+        if not release_engine(engine):
+            return
         try:
             # pysnmp 7.x (v3arch asyncio): close the transport dispatcher.
-            dispatcher = getattr(self.engine, "transportDispatcher", None)
+            # Newer releases use snake_case names; the camelCase ones remain as
+            # deprecated aliases on some versions and are gone on others.
+            dispatcher = getattr(engine, "transport_dispatcher", None) or getattr(
+                engine, "transportDispatcher", None
+            )
             if dispatcher is not None:
-                if hasattr(dispatcher, "closeDispatcher"):
-                    dispatcher.closeDispatcher()
+                close = getattr(dispatcher, "close_dispatcher", None) or getattr(
+                    dispatcher, "closeDispatcher", None
+                )
+                if close is not None:
+                    close()
         except Exception:
             pass
-        finally:
-            self.engine = None
-            self.target = None
 
     async def async_initialize(self) -> None:
-        await self.hass.async_add_executor_job(self._load_database)
-        await self._ensure_engine()
+        # SNMP I/O is native asyncio; only these two blocking setup steps use
+        # the executor, and they are independent, so run them side by side.
+        await asyncio.gather(
+            self.hass.async_add_executor_job(self._load_database),
+            self._ensure_engine(),
+        )
         await self._ensure_target()
 
         # Issue a warm-up GET to flush any remaining lazy pysnmp internal state and verify auth/connection.
@@ -275,46 +480,77 @@ class SwitchSnmpClient:
         await self._async_get_one(OID_sysDescr)
 
     async def _async_get_one(self, oid: str) -> Optional[str]:
-        await self._ensure_engine()
-        await self._ensure_target()
+        await self._ensure_session()
         return await _do_get_one(self.engine, self.auth_data, self.target, self.context, oid)
 
-    async def _async_walk(self, base_oid: str) -> list[tuple[str, Any]]:
-        await self._ensure_engine()
-        await self._ensure_target()
-        return await _do_next_walk(self.engine, self.auth_data, self.target, self.context, base_oid)
+    async def _async_get_many(
+        self, oids: list[str], no_such: Optional[set[str]] = None
+    ) -> Dict[str, Optional[str]]:
+        """GET several OIDs in as few PDUs as possible."""
+        await self._ensure_session()
+        return await _do_get_many(self.engine, self.auth_data, self.target, self.context, oids, no_such)
+
+    async def _async_walk(self, base_oid: str, max_rows: Optional[int] = None) -> list[tuple[str, Any]]:
+        await self._ensure_session()
+        async with self._walk_sem:
+            return await _do_bulk_walk(
+                self.engine, self.auth_data, self.target, self.context, base_oid, self.max_repetitions, max_rows
+            )
+
+    async def _async_walk_iter(self, base_oid: str) -> AsyncIterator[tuple[str, Any]]:
+        """Yield (oid, value) rows of a walk as each GETBULK response arrives."""
+        await self._ensure_session()
+        async with self._walk_sem:
+            async for _base, oid, val in _iter_bulk_walk_columns(
+                self.engine, self.auth_data, self.target, self.context, [base_oid], self.max_repetitions
+            ):
+                yield oid, val
+
+    async def _async_walk_columns(self, base_oids: Sequence[str]) -> Dict[str, list[tuple[str, Any]]]:
+        """Walk several table columns (from one or more tables) in shared GETBULK requests."""
+        await self._ensure_session()
+        async with self._walk_sem:
+            return await _do_bulk_walk_columns(
+                self.engine, self.auth_data, self.target, self.context, base_oids, self.max_repetitions
+            )
 
 
 
 
     async def async_refresh_all(self) -> None:
-        await self._ensure_engine()
-        await self._ensure_target()
+        await self._ensure_session()
         await poll_interfaces(self, dynamic_only=False)
-        await poll_ipv4(self)
+        self._schedule_static_walks(time.monotonic())
+        # Count this as the throttled IPv4 poll so the next dynamic refresh
+        # doesn't walk the same address tables again straight away.
+        await self._async_poll_ipv4(time.monotonic())
 
     async def async_refresh_dynamic(self) -> None:
-        await self._ensure_engine()
-        await self._ensure_target()
-        if not self.cache.get("ifTable"):
+        await self._ensure_session()
+        now_mono = time.monotonic()
+        if not self.cache.get("ifTable") or self._static_refresh_due or now_mono >= self._next_static_walk:
+            self._static_refresh_due = False
             await poll_interfaces(self, dynamic_only=False)
+            # The full walk swaps in a rebuilt ifTable; put the cached addresses
+            # back on the new rows (before anything else can run) rather than
+            # leaving ports without an IP until the next (throttled) IPv4 poll.
+            _attach_ipv4_to_interfaces(self)
+            self._schedule_static_walks(now_mono)
         else:
+            if now_mono >= self._next_alias_walk:
+                self._next_alias_walk = now_mono + _jittered(DEFAULT_ALIAS_REFRESH_INTERVAL)
+                await poll_if_aliases(self)
             await poll_interfaces(self, dynamic_only=True)
         # IPv4 data rarely changes; throttle separately (default 300 s).
         now_mono = time.monotonic()
-        if (
-            self._last_ipv4_poll == 0.0
-            or (now_mono - self._last_ipv4_poll) >= self._ipv4_poll_interval
-        ):
-            self._last_ipv4_poll = now_mono
-            await poll_ipv4(self)
+        if self._ipv4_poll_due(now_mono):
+            await self._async_poll_ipv4(now_mono)
 
     # ---------- coordinator hook ----------
     async def async_poll(self) -> Dict[str, Any]:
         # Keep system/diagnostic fields fresh (e.g., sysUpTime) so diagnostic
         # sensors update without requiring an integration restart.
-        await self._ensure_engine()
-        await self._ensure_target()
+        await self._ensure_session()
 
         # sysUpTime can be very "chatty"; poll it less frequently.
         now_mono = time.monotonic()
@@ -331,13 +567,27 @@ class SwitchSnmpClient:
         syscontact_oid = self._custom_oid("contact") or OID_sysContact
         syslocation_oid = self._custom_oid("location") or OID_sysLocation
 
-        sysdescr, sysname, sysuptime, syscontact, syslocation = await asyncio.gather(
-            _do_get_one(self.engine, self.auth_data, self.target, self.context, OID_sysDescr),
-            _do_get_one(self.engine, self.auth_data, self.target, self.context, sysname_oid),
-            _do_get_one(self.engine, self.auth_data, self.target, self.context, uptime_oid) if poll_uptime else asyncio.sleep(0, result=None),
-            _do_get_one(self.engine, self.auth_data, self.target, self.context, syscontact_oid),
-            _do_get_one(self.engine, self.auth_data, self.target, self.context, syslocation_oid),
-        )
+        # One PDU for all system scalars instead of a GET per field.
+        sys_oids = [OID_sysDescr, sysname_oid, syscontact_oid, syslocation_oid]
+        if poll_uptime:
+            sys_oids.append(uptime_oid)
+        sys_oids = [oid for oid in sys_oids if oid not in self._unsupported_sys_oids]
+        no_such: set[str] = set()
+        values = await self._async_get_many(sys_oids, no_such)
+        gaps = [oid for oid in sys_oids if values.get(oid) is None]
+        if gaps and len(gaps) == len(sys_oids) > 1 and not no_such:
+            # A bad custom OID can fail the whole PDU; retry each OID on its own.
+            singles = await asyncio.gather(*(self._async_get_many([oid], no_such) for oid in gaps))
+            for single in singles:
+                values.update(single)
+        # Only an explicit noSuchObject/noSuchInstance means the agent lacks the
+        # OID; error statuses (genErr, tooBig, ...) are simply retried next poll.
+        self._unsupported_sys_oids.update(no_such)
+        sysdescr = values.get(OID_sysDescr)
+        sysname = values.get(sysname_oid)
+        sysuptime = values.get(uptime_oid) if poll_uptime else None
+        syscontact = values.get(syscontact_oid)
+        syslocation = values.get(syslocation_oid)
         if (not poll_uptime) and ("sysUpTime" in self.cache):
             sysuptime = self.cache.get("sysUpTime")
         if sysdescr is not None:
@@ -345,12 +595,41 @@ class SwitchSnmpClient:
         if sysname is not None:
             self.cache["sysName"] = sysname
         if sysuptime is not None:
+            prev_ticks = _parse_numeric(self.cache.get("sysUpTime"))
+            new_ticks = _parse_numeric(sysuptime)
+            if prev_ticks is not None and new_ticks is not None and new_ticks < prev_ticks:
+                self._last_if_index_walk = 0.0
+                self._static_refresh_due = True
+                self._device_info_sysdescr = None
+                # New firmware may implement scalars the old image lacked.
+                self._unsupported_sys_oids.clear()
+                # Addresses may have changed with the restart; re-walk them now.
+                self._last_ipv4_poll = 0.0
+                self._ipv4_empty_polls = 0
             self.cache["sysUpTime"] = sysuptime
         if syscontact is not None:
             self.cache["sysContact"] = syscontact
         if syslocation is not None:
             self.cache["sysLocation"] = syslocation
 
+        # Interfaces (then bandwidth, which picks its ports from ifTable) don't
+        # depend on the vendor, so walk them while device info is resolved;
+        # the shared walk semaphore still bounds load on the agent.
+        interfaces_done = asyncio.Event()
+        results = await asyncio.gather(
+            self._async_poll_interfaces(interfaces_done),
+            self._async_poll_vendor_tables(now_mono, interfaces_done),
+            return_exceptions=True,
+        )
+        # Interface and device-info failures (e.g. the switch going away) must
+        # reach the coordinator.
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return self.cache
+
+    async def _async_poll_vendor_tables(self, now_mono: float, interfaces_done: asyncio.Event) -> None:
         # Populate manufacturer, firmware, model, and vendor flags dynamically on first poll
         if not self.cache.get("manufacturer"):
             await initialize_device_info(self)
@@ -358,18 +637,34 @@ class SwitchSnmpClient:
             # Re-evaluate manufacturer/firmware from sysDescr on each subsequent poll
             await refresh_device_info(self)
 
-        await self.async_refresh_dynamic()
+        # PoE and the environmental pollers pick their OIDs by vendor and fill
+        # disjoint cache keys, so overlap them once device info is known.
+        await asyncio.gather(
+            self._async_poll_poe(interfaces_done),
+            self._async_poll_environment(now_mono),
+            return_exceptions=True,
+        )
+
+    async def _async_poll_interfaces(self, interfaces_done: asyncio.Event) -> None:
+        try:
+            await self.async_refresh_dynamic()
+        finally:
+            interfaces_done.set()
 
         # Bandwidth counters (optional; per-device)
         await poll_bandwidth(self)
 
+    async def _async_poll_poe(self, interfaces_done: asyncio.Event) -> None:
+        # PoE ports are keyed by ifIndex through the interface walk's
+        # bridge base-port map, so wait for that walk to finish.
+        await interfaces_done.wait()
         # PoE (optional)
         try:
             await poll_poe(self)
         except Exception as e:
             _LOGGER.debug("PoE polling failed: %s", e)
 
-
+    async def _async_poll_environment(self, now_mono: float) -> None:
         # Environmental power (Dell N-Series via private MIB)
         env_enabled = bool(self._env_options.get(CONF_ENV_ENABLE, False))
         env_mode = self._env_options.get(CONF_ENV_MODE, ENV_MODE_ATTRIBUTES)
@@ -400,40 +695,29 @@ class SwitchSnmpClient:
                     else:
                         vendor = self.cache.get("vendor", "Unknown")
 
-                        # Memory
-                        await poll_memory(self, vendor)
-
-                        # CPU
-                        await poll_cpu(self, vendor)
-
-                        # Power
-                        await poll_power(self, vendor)
-
-                        # Fans
-                        await poll_fans(self, vendor)
-
-                        # PSU
-                        await poll_psu(self, vendor)
-
-                        # Temperature
-                        await poll_temperature(self, vendor)
-
-                        # Fallback
+                        # Memory, CPU, power, fans, PSU and temperature each
+                        # fill their own cache keys; poll them concurrently.
+                        results = await asyncio.gather(
+                            poll_memory(self, vendor),
+                            poll_cpu(self, vendor),
+                            poll_power(self, vendor),
+                            poll_fans(self, vendor),
+                            poll_psu(self, vendor),
+                            poll_temperature(self, vendor),
+                            return_exceptions=True,
+                        )
+                        for res in results:
+                            if isinstance(res, Exception):
+                                _LOGGER.debug("Environmental feature polling failed: %s", res)
+
+                        # Fallback (fills whatever the vendor pollers left empty)
                         await poll_entity_sensor_fallback(self)
                 except Exception as e:
                     _LOGGER.debug("Environmental features polling failed: %s", e)
 
-
-
-
-
-        return self.cache
-
     # ---------- mutations ----------
     async def set_alias(self, if_index: int, alias: str) -> bool:
-        await self._ensure_engine()
-        await self._ensure_target()
-        ok = await _do_set_alias(self.engine, self.auth_data, self.target, self.context, if_index, alias)
+        ok = await self._batched_set(_do_set_aliases, if_index, alias)
         if ok:
             self.cache.setdefault("ifTable", {}).setdefault(if_index, {})["alias"] = alias
         else:
@@ -441,13 +725,59 @@ class SwitchSnmpClient:
         return ok
 
     async def set_admin_status(self, if_index: int, value: int) -> bool:
-        await self._ensure_engine()
-        await self._ensure_target()
-        return await _do_set_admin_status(self.engine, self.auth_data, self.target, self.context, if_index, value)
+        return await self._batched_set(_do_set_admin_statuses, if_index, value)
+
+    async def _batched_set(self, setter, if_index: int, value: Any) -> bool:
+        batch = self._set_batches.get(setter)
+        if batch is None:
+            values: Dict[int, Any] = {}
+            # The batch runs in its own task so cancelling one caller (a service
+            # call timeout, an entity being removed) can't drop the other ports' writes.
+            task = self.hass.async_create_task(self._run_set_batch(setter, values))
+            task.add_done_callback(_consume_task_exception)
+            self._set_batches[setter] = (values, task)
+        else:
+            values, task = batch
+        values[if_index] = value
+        return (await asyncio.shield(task)).get(if_index, False)
+
+    async def _run_set_batch(self, setter, values: Dict[int, Any]) -> Dict[int, bool]:
+        try:
+            # Let other writes issued in this loop pass join the batch.
+            await asyncio.sleep(0)
+        finally:
+            self._set_batches.pop(setter, None)
+        return await self._flush_set_batch(setter, values)
+
+    async def _flush_set_batch(self, setter, values: Dict[int, Any]) -> Dict[int, bool]:
+        """Write batched column values, dropping ports the agent rejects."""
+        await self._ensure_session()
+        results: Dict[int, bool] = {}
+        pending = dict(values)
+        # SET is atomic: one bad port fails the whole PDU. Drop the port named by
+        # the error-index and resend the rest until the PDU goes through.
+        while pending:
+            ok, failed = await setter(self.engine, self.auth_data, self.target, self.context, pending)
+            if ok:
+                results.update(dict.fromkeys(pending, True))
+                break
+            if len(pending) == 1:
+                results.update(dict.fromkeys(pending, False))
+                break
+            if failed is None:
+                # The agent didn't say which varbind failed; fall back to one SET each.
+                for if_index, value in pending.items():
+                    ok, _failed = await setter(
+                        self.engine, self.auth_data, self.target, self.context, {if_index: value}
+                    )
+                    results[if_index] = ok
+                break
+            results[failed] = False
+            del pending[failed]
+        return results
 
     async def set_poe_admin(self, group_index: int, port_index: int, value: int) -> bool:
-        await self._ensure_engine()
-        await self._ensure_target()
+        await self._ensure_session()
         vendor = self.cache.get("vendor", "Unknown")
         poe_items = self._get_database_oids("poe", vendor)
         standard_item = None
@@ -471,8 +801,7 @@ class SwitchSnmpClient:
         return ok
 
     async def set_poe_priority(self, group_index: int, port_index: int, value: int) -> bool:
-        await self._ensure_engine()
-        await self._ensure_target()
+        await self._ensure_session()
         vendor = self.cache.get("vendor", "Unknown")
         poe_items = self._get_database_oids("poe", vendor)
         standard_item = None
@@ -496,8 +825,7 @@ class SwitchSnmpClient:
         return ok
 
     async def set_system_string(self, oid: str, value: str) -> bool:
-        await self._ensure_engine()
-        await self._ensure_target()
+        await self._ensure_session()
         ok = await _do_set_system_string(self.engine, self.auth_data, self.target, self.context, oid, value)
         if ok:
             if oid in (OID_sysName, self._custom_oid("name"), self._custom_oid("hostname")):
@@ -112,17 +112,25 @@ __all__ = [
     "_do_get_one",
     "_do_get_many",
     "_do_next_walk",
+    "_do_bulk_walk",
+    "_do_bulk_walk_columns",
+    "_iter_bulk_walk_columns",
     "_do_set_alias",
+    "_do_set_aliases",
     "_do_set_admin_status",
+    "_do_set_admin_statuses",
     "_do_set_poe_admin",
     "_do_set_poe_priority",
     "_do_set_system_string",
 ]
 
-from typing import Any, Optional, Dict, Tuple, List
+import asyncio
+from typing import Any, AsyncIterator, Optional, Dict, Tuple, List, Sequence
 
 # OIDs required for sets
 from .const import (
+    DEFAULT_BULK_MAX_REPETITIONS,
+    GET_MANY_MAX_VARBINDS,
     OID_ifAlias,
     OID_ifAdminStatus,
     OID_pethPsePortAdminEnable,
@@ -138,6 +146,9 @@ _AUTH_ERROR_PHRASES = (
     "unsupportedsecuritylevel",
 )
 
+_NO_SUCH_TYPES = ("NoSuchObject", "NoSuchInstance")
+_END_OF_WALK_TYPES = ("EndOfMibView",) + _NO_SUCH_TYPES
+
 
 class SnmpAuthError(Exception):
     """Raised when SNMP authentication fails."""
@@ -167,9 +178,16 @@ async def _do_get_one(engine, community, target, context, oid: str) -> Optional[
     return str(vbs[0][1]) if vbs else None
 
 
-async def _do_get_many(engine, community, target, context, oids: list[str]) -> Dict[str, Optional[str]]:
-    import asyncio
-    chunk_size = 32
+async def _do_get_many(
+    engine, community, target, context, oids: list[str], no_such: Optional[set[str]] = None
+) -> Dict[str, Optional[str]]:
+    """GET oids in chunked PDUs; missing or failed values come back as None.
+
+    When no_such is given, OIDs the agent explicitly answered with
+    noSuchObject/noSuchInstance are added to it, so callers can tell them
+    apart from a chunk that failed with an error status.
+    """
+    chunk_size = GET_MANY_MAX_VARBINDS
     results = {}
 
     chunks = [oids[i : i + chunk_size] for i in range(0, len(oids), chunk_size)]
@@ -185,7 +203,16 @@ async def _do_get_many(engine, community, target, context, oids: list[str]) -> D
             raise SnmpConnectionError(str(err_ind))
         if err_stat:
             return {oid: None for oid in chunk}
-        return {oid: (str(vbs[i][1]) if i < len(vbs) else None) for i, oid in enumerate(chunk)}
+        out: Dict[str, Optional[str]] = {}
+        for i, oid in enumerate(chunk):
+            val = vbs[i][1] if i < len(vbs) else None
+            # Unsupported OIDs come back as noSuchObject/noSuchInstance; report them as missing.
+            if val is not None and type(val).__name__ in _NO_SUCH_TYPES:
+                if no_such is not None:
+                    no_such.add(oid)
+                val = None
+            out[oid] = None if val is None else str(val)
+        return out
 
     chunk_results = await asyncio.gather(*[_fetch_chunk(c) for c in chunks])
     for r in chunk_results:
@@ -194,9 +221,17 @@ async def _do_get_many(engine, community, target, context, oids: list[str]) -> D
     return results
 
 
-async def _do_next_walk(engine, community, target, context, base_oid: str) -> List[Tuple[str, Any]]:
+# SNMP error-status tooBig(1): the response would not fit in one message.
+_ERR_STATUS_TOO_BIG = 1
+
+
+async def _do_next_walk(
+    engine, community, target, context, base_oid: str, start_oid: Optional[str] = None
+) -> List[Tuple[str, Any]]:
     results = []
-    current_oid = base_oid
+    base_oid = base_oid.rstrip(".")
+    base_prefix = base_oid + "."
+    current_oid = start_oid or base_oid
     while True:
         err_ind, err_stat, _err_idx, vbs = await next_cmd(
             engine, community, target, context, ObjectType(ObjectIdentity(current_oid)), lookupMib=False
@@ -209,37 +244,184 @@ async def _do_next_walk(engine, community, target, context, base_oid: str) -> Li
             break
         oid, val = vbs[0]
         oid_str = str(oid)
-        if not oid_str.startswith(base_oid):
+        # Stop as soon as the agent leaves the subtree (a bare startswith(base)
+        # would let ".1.1" run on into ".1.10") or stops making progress.
+        if not oid_str.startswith(base_prefix) or oid_str == current_oid:
+            break
+        if type(val).__name__ in _END_OF_WALK_TYPES:
             break
         results.append((oid_str, val))
         current_oid = oid_str
     return results
 
 
+
+def _flatten_var_binds(vbs) -> list:
+    """Return GETBULK var-binds as a flat list (legacy PySNMP returns a table)."""
+    flat = []
+    for vb in vbs or ():
+        if isinstance(vb, (list, tuple)):
+            flat.extend(vb)
+        else:
+            flat.append(vb)
+    return flat
+
+
+async def _iter_bulk_walk_columns(
+    engine, community, target, context, base_oids: Sequence[str],
+    max_repetitions: int = DEFAULT_BULK_MAX_REPETITIONS,
+    max_rows: Optional[int] = None,
+) -> AsyncIterator[Tuple[str, str, Any]]:
+    """Walk several table columns together using multi-varbind GETBULK requests.
+
+    Yields (base OID, oid, value) as each response arrives, in walk order per
+    column. Agents that answer GETBULK with an error status are finished off
+    with GETNEXT; a ``tooBig`` reply halves max-repetitions and retries first.
+    When the caller knows how many rows a column has, passing ``max_rows``
+    ends it there instead of paying a round trip to see the end.
+    """
+    current = {base: base for base in base_oids}
+    prefixes = {base: base.rstrip(".") + "." for base in base_oids}
+    counts = {base: 0 for base in base_oids}
+    active = list(dict.fromkeys(base_oids))
+    if max_rows is not None and max_rows <= 0:
+        return
+
+    while active:
+        reps = max_repetitions
+        if max_rows is not None:
+            reps = max(1, min(max_repetitions, max(max_rows - counts[base] for base in active)))
+        err_ind, err_stat, _err_idx, vbs = await bulk_cmd(
+            engine, community, target, context,
+            0, reps,
+            *[ObjectType(ObjectIdentity(current[base])) for base in active],
+            lookupMib=False,
+        )
+        if err_ind:
+            if _is_auth_error(err_ind):
+                raise SnmpAuthError(str(err_ind))
+            raise SnmpConnectionError(str(err_ind))
+        if err_stat:
+            if int(err_stat) == _ERR_STATUS_TOO_BIG and reps > 1:
+                max_repetitions = reps // 2
+                continue
+            for base in active:
+                for oid_str, val in await _do_next_walk(
+                    engine, community, target, context, base, current[base]
+                ):
+                    yield base, oid_str, val
+            break
+        flat = _flatten_var_binds(vbs)
+        if not flat:
+            break
+
+        done: set[str] = set()
+        progressed = False
+        width = len(active)
+        for pos, (oid, val) in enumerate(flat):
+            base = active[pos % width]
+            if base in done:
+                continue
+            oid_str = str(oid)
+            if (
+                type(val).__name__ in _END_OF_WALK_TYPES
+                or not oid_str.startswith(prefixes[base])
+                or oid_str == current[base]
+            ):
+                done.add(base)
+                continue
+            current[base] = oid_str
+            progressed = True
+            yield base, oid_str, val
+            counts[base] += 1
+            if max_rows is not None and counts[base] >= max_rows:
+                done.add(base)
+
+        if not progressed:
+            break
+        active = [base for base in active if base not in done]
+
+
+async def _do_bulk_walk_columns(
+    engine, community, target, context, base_oids: Sequence[str],
+    max_repetitions: int = DEFAULT_BULK_MAX_REPETITIONS,
+    max_rows: Optional[int] = None,
+) -> Dict[str, List[Tuple[str, Any]]]:
+    """Walk several table columns together; returns base OID -> [(oid, value), ...]."""
+    results: Dict[str, List[Tuple[str, Any]]] = {base: [] for base in base_oids}
+    async for base, oid_str, val in _iter_bulk_walk_columns(
+        engine, community, target, context, base_oids, max_repetitions, max_rows
+    ):
+        results[base].append((oid_str, val))
+    return results
+
+
+async def _do_bulk_walk(
+    engine, community, target, context, base_oid: str,
+    max_repetitions: int = DEFAULT_BULK_MAX_REPETITIONS,
+    max_rows: Optional[int] = None,
+) -> List[Tuple[str, Any]]:
+    """Walk a single subtree with GETBULK."""
+    columns = await _do_bulk_walk_columns(
+        engine, community, target, context, [base_oid], max_repetitions, max_rows
+    )
+    return columns[base_oid]
+
+
 async def _do_set_alias(engine, community, target, context, if_index: int, alias: str) -> bool:
-    err_ind, err_stat, _err_idx, _vbs = await set_cmd(
-        engine, community, target, context,
-        ObjectType(ObjectIdentity(f"{OID_ifAlias}.{if_index}"), OctetString(alias)),
-        lookupMib=False,
+    ok, _failed = await _do_set_aliases(engine, community, target, context, {if_index: alias})
+    return ok
+
+
+async def _do_set_aliases(
+    engine, community, target, context, aliases: Dict[int, str]
+) -> Tuple[bool, Optional[int]]:
+    """Set ifAlias for several interfaces in one SET PDU (all-or-nothing)."""
+    return await _do_set_column(
+        engine, community, target, context, OID_ifAlias,
+        {if_index: OctetString(alias) for if_index, alias in aliases.items()},
     )
-    if err_ind:
-        if _is_auth_error(err_ind):
-            raise SnmpAuthError(str(err_ind))
-        raise SnmpConnectionError(str(err_ind))
-    return (not err_ind) and (not err_stat)
 
 
 async def _do_set_admin_status(engine, community, target, context, if_index: int, state: int) -> bool:
-    err_ind, err_stat, _err_idx, _vbs = await set_cmd(
+    ok, _failed = await _do_set_admin_statuses(engine, community, target, context, {if_index: state})
+    return ok
+
+
+async def _do_set_admin_statuses(
+    engine, community, target, context, states: Dict[int, int]
+) -> Tuple[bool, Optional[int]]:
+    """Set ifAdminStatus for several interfaces in one SET PDU (all-or-nothing)."""
+    return await _do_set_column(
+        engine, community, target, context, OID_ifAdminStatus,
+        {if_index: Integer(state) for if_index, state in states.items()},
+    )
+
+
+async def _do_set_column(
+    engine, community, target, context, base_oid: str, values: Dict[int, Any]
+) -> Tuple[bool, Optional[int]]:
+    """Write one column for several ifIndexes in a single SET PDU.
+
+    Returns (ok, ifIndex named by the agent's error-index when it rejected the PDU).
+    """
+    if_indexes = list(values)
+    err_ind, err_stat, err_idx, _vbs = await set_cmd(
         engine, community, target, context,
-        ObjectType(ObjectIdentity(f"{OID_ifAdminStatus}.{if_index}"), Integer(state)),
+        *(ObjectType(ObjectIdentity(f"{base_oid}.{if_index}"), value) for if_index, value in values.items()),
         lookupMib=False,
     )
     if err_ind:
         if _is_auth_error(err_ind):
             raise SnmpAuthError(str(err_ind))
         raise SnmpConnectionError(str(err_ind))
-    return (not err_ind) and (not err_stat)
+    if not err_stat:
+        return True, None
+    try:
+        pos = int(err_idx) - 1  # error-index is 1-based; 0 means "not attributable"
+    except (TypeError, ValueError):
+        pos = -1
+    return False, if_indexes[pos] if 0 <= pos < len(if_indexes) else None
 
 
 async def _do_set_poe_admin(engine, community, target, context, group_index: int, port_index: int, state: int, oid: Optional[str] = None) -> bool:
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import ipaddress
 import logging
-from typing import Any, Dict, Optional
+from typing import Any
 
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers import entity_registry as er
@@ -11,12 +10,6 @@ from ..const import (
     DOMAIN,
     CONF_LEGACY_DEVICE_ID,
     CONF_ICON_RULES,
-    CONF_INCLUDE_STARTS_WITH,
-    CONF_INCLUDE_CONTAINS,
-    CONF_INCLUDE_ENDS_WITH,
-    CONF_EXCLUDE_STARTS_WITH,
-    CONF_EXCLUDE_CONTAINS,
-    CONF_EXCLUDE_ENDS_WITH,
     CONF_DISABLED_VENDOR_FILTER_RULE_IDS,
     CONF_POE_CONTROL_LOOPS,
 )
@@ -49,61 +42,39 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     device_info = DeviceInfo(identifiers=identifiers, name=hostname)
 
-    ip_index = client.cache.get("ipIndex", {})
-    ip_mask = client.cache.get("ipMask", {})
+    ip_cidr = client.cache.get("ipCidr", {}) or {}
 
-    ip_by_ifindex = {}
-    for ip, idx in ip_index.items():
-        try:
-            ip_by_ifindex[int(idx)] = ip
-        except Exception:
-            pass
-
-    # Include/Exclude interface rules (simple string match; include wins over exclude)
-    include_starts = tuple(str(s).strip().lower() for s in (entry.options.get(CONF_INCLUDE_STARTS_WITH, []) or []) if str(s).strip())
-    include_contains = [str(s).strip().lower() for s in (entry.options.get(CONF_INCLUDE_CONTAINS, []) or []) if str(s).strip()]
-    include_ends = tuple(str(s).strip().lower() for s in (entry.options.get(CONF_INCLUDE_ENDS_WITH, []) or []) if str(s).strip())
-
-    exclude_starts = tuple(str(s).strip().lower() for s in (entry.options.get(CONF_EXCLUDE_STARTS_WITH, []) or []) if str(s).strip())
-    exclude_contains = [str(s).strip().lower() for s in (entry.options.get(CONF_EXCLUDE_CONTAINS, []) or []) if str(s).strip()]
-    exclude_ends = tuple(str(s).strip().lower() for s in (entry.options.get(CONF_EXCLUDE_ENDS_WITH, []) or []) if str(s).strip())
-
-    any_include_rules = bool(include_starts or include_contains or include_ends)
+    # Include/Exclude interface rules (simple string match; exclude wins over
+    # include). The client compiled them from the same options when the entry
+    # was set up, one alternation per rule set.
+    include_re, exclude_re = client.interface_filters
 
     disabled_vendor_filter_ids = set(entry.options.get(CONF_DISABLED_VENDOR_FILTER_RULE_IDS, []) or [])
 
     icon_rules = entry.options.get(CONF_ICON_RULES, []) or []
 
-    def _matches_any(name_l: str, starts: tuple[str, ...], contains: list[str], ends: tuple[str, ...]) -> bool:
-        if starts and name_l.startswith(starts):
-            return True
-        if ends and name_l.endswith(ends):
-            return True
-        if contains and any(x in name_l for x in contains):
-            return True
-        return False
-
     vendor = client.cache.get("vendor", "Unknown")
     manufacturer = client.cache.get("manufacturer") or ""
     sys_descr = client.cache.get("sysDescr") or ""
     db_filters = client._database if hasattr(client, "_database") else None
+    classification_db = db_filters.get("interface_classification") if db_filters is not None else None
 
     for idx, row in sorted(iftable.items()):
         raw_name = row.get("display_name") or row.get("name") or row.get("descr") or f"if{idx}"
         alias = row.get("alias") or ""
 
         normalized_name = (raw_name or "").strip().lower()
-        ip_str = _ip_for_index(idx, ip_by_ifindex, ip_mask)
+        ip_str = ip_cidr.get(idx)
 
-        include_hit = _matches_any(normalized_name, include_starts, include_contains, include_ends)
-        exclude_hit = _matches_any(normalized_name, exclude_starts, exclude_contains, exclude_ends)
+        include_hit = include_re is not None and include_re.search(normalized_name) is not None
+        exclude_hit = exclude_re is not None and exclude_re.search(normalized_name) is not None
 
         # Exclude rules always win.
         if exclude_hit:
             continue
 
         # If include rules exist, only matching interfaces are created.
-        if any_include_rules and not include_hit:
+        if include_re is not None and not include_hit:
             continue
 
         is_port_channel = (
@@ -156,8 +127,9 @@ async def async_setup_entry(hass, entry, async_add_entities):
         except Exception:
             pass
 
-        db = client._database.get("interface_classification") if hasattr(client, "_database") else None
-        display = format_interface_name(raw_for_display, unit=unit, slot=slot, port=port, classification_db=db)
+        display = format_interface_name(
+            raw_for_display, unit=unit, slot=slot, port=port, classification_db=classification_db
+        )
         display_names[idx] = display
 
         entities.append(
@@ -230,24 +202,3 @@ async def async_setup_entry(hass, entry, async_add_entities):
     async_add_entities(entities)
 
 
-def _ip_for_index(if_index: int, ip_by_ifindex: Dict[int, str], ip_mask: Dict[str, str]) -> Optional[str]:
-    """Return IP/maskbits string for an ifIndex if present."""
-    ip = ip_by_ifindex.get(if_index)
-    if not ip:
-        return None
-    mask = ip_mask.get(ip)
-    if not mask:
-        return ip
-    try:
-        mask_parts = [int(p) for p in mask.split(".")]
-        if len(mask_parts) == 4:
-            prefix_len = sum(bin(x).count('1') for x in mask_parts)
-            return f"{ip}/{prefix_len}"
-    except Exception:
-        pass
-
-    try:
-        net = ipaddress.IPv4Network((ip, mask), strict=False)
-        return f"{ip}/{net.prefixlen}"
-    except Exception:
-        return ip
@@ -228,8 +228,8 @@ class IfAdminSwitch(CoordinatorEntity, SwitchEntity):
 
         hide_ip_on_physical = bool(data.get("hide_ip_on_physical", False))
 
-        from . import _ip_for_index
-        ip = _ip_for_index(self._if_index, data.get("ip_by_ifindex", {}), data.get("ip_mask_by_ifindex", {}))
+        # poll_ipv4 already resolved the address and prefix length for this row.
+        ip = row.get("ip_cidr_str") or row.get("ip")
         if ip and not (hide_ip_on_physical and port_type == "physical"):
             attrs["IP"] = ip
 